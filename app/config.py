@@ -9,6 +9,8 @@ class Settings(BaseSettings):
     # Redis Configuration
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_CACHE_DB: int = 1
+    REDIS_ANALYTICS_REFRESH_SECONDS: int = 0  # >0 counts cache keys in a background thread
+    ENABLE_CLIENT_CACHE: bool = False  # RESP3 client-side caching (Redis 6+, redis-py 5.1+)
     CELERY_CUSTOM_WORKER_POOL: Optional[str] = None
     # Celery Configuration
     CELERY_BROKER_URL: str = "redis://localhost:6379/0"
@@ -39,6 +41,7 @@ class Settings(BaseSettings):
     ENABLE_CONTENT_ENHANCEMENT: bool = True  # Rule-based improvements
     ENABLE_TOPIC_CLASSIFICATION: bool = True  # Keyword-based classification
     ENABLE_SUMMARIZATION: bool = True  # Basic text summarization
+    HASH_NORMALIZER_CACHE_SIZE: int = 50000  # LRU entries per hash normalizer
     
     # Rate Limiting
     RSS_CONCURRENT_REQUESTS: int = 10
@@ -5,7 +5,7 @@ Implements sophisticated caching strategies for production-scale news delivery
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Set, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 import logging
 from dataclasses import dataclass
 from collections import defaultdict
@@ -16,9 +16,25 @@ from app.models.source import NewsSource
 from app.database import AsyncSessionLocal
 from app.config import settings
 from sqlalchemy import select, func, and_, desc
+from sqlalchemy.engine import Row
 
 logger = logging.getLogger(__name__)
 
+# Columns the hash cache and invalidation need - select these instead of full
+# Article entities to skip ORM hydration and identity-map overhead
+ARTICLE_CACHE_COLUMNS = (
+    Article.id,
+    Article.title,
+    Article.url,
+    Article.source_name,
+    Article.primary_topic,
+    Article.discovered_at,
+    Article.content_hash,
+)
+
+# Full ORM instance or a lightweight row selected with ARTICLE_CACHE_COLUMNS
+ArticleLike = Union[Article, Row]
+
 @dataclass
 class CacheConfig:
     """Cache layer configuration with production-ready defaults"""
@@ -93,7 +109,7 @@ class AdvancedCacheManager:
     
     # === LAYER 1: CONTENT HASH CACHE ===
     
-    async def cache_article_by_hash(self, article: Article) -> bool:
+    async def cache_article_by_hash(self, article: ArticleLike) -> bool:
         """Cache article by content hash for fast deduplication"""
         try:
             article_data = {
@@ -153,6 +169,7 @@ class AdvancedCacheManager:
                     priority_topics = await self._get_active_topics()
                 
                 results = {}
+                topic_articles: Dict[str, List[int]] = {}
                 
                 async with AsyncSessionLocal() as session:
                     for topic in priority_topics:
@@ -171,13 +188,8 @@ class AdvancedCacheManager:
                             article_ids = [row.id for row in result.fetchall()]
                             
                             if article_ids:
-                                self.redis.cache_articles_by_topic(
-                                    topic, 
-                                    article_ids, 
-                                    self.config.topic_cache_ttl
-                                )
+                                topic_articles[topic] = article_ids
                                 results[topic] = len(article_ids)
-                                self.analytics.record_write()
                             else:
                                 results[topic] = 0
                                 
@@ -185,6 +197,15 @@ class AdvancedCacheManager:
                             logger.error(f"Error warming cache for topic {topic}: {e}")
                             results[topic] = 0
                 
+                # Write all topic lists in one pipelined round-trip
+                if topic_articles:
+                    if self.redis.cache_articles_by_topics_batch(topic_articles, self.config.topic_cache_ttl):
+                        for _ in topic_articles:
+                            self.analytics.record_write()
+                    else:
+                        for topic in topic_articles:
+                            results[topic] = 0
+                
                 logger.info(f"Warmed topic caches: {results}")
                 return results
                 
@@ -225,6 +246,7 @@ class AdvancedCacheManager:
                 }
                 
                 results = {}
+                bucket_ids = {}
                 
                 async with AsyncSessionLocal() as session:
                     for bucket_name, cutoff_time in time_buckets.items():
@@ -236,24 +258,31 @@ class AdvancedCacheManager:
                                 .limit(self.config.max_articles_per_cache)
                             )
                             
-                            article_ids = [row.id for row in result.fetchall()]
-                            
-                            success = self.redis.cache_articles_by_recency(
-                                bucket_name, 
-                                article_ids, 
-                                self.config.recency_cache_ttl
-                            )
-                            
-                            if success:
-                                results[bucket_name] = len(article_ids)
-                                self.analytics.record_write()
-                            else:
-                                results[bucket_name] = 0
+                            bucket_ids[bucket_name] = [row.id for row in result.fetchall()]
                                 
                         except Exception as e:
                             logger.error(f"Error warming recency cache {bucket_name}: {e}")
                             results[bucket_name] = 0
                 
+                # Write every bucket in one round-trip
+                if bucket_ids:
+                    pipe = self.redis.raw_client.pipeline(transaction=False)
+                    for bucket_name, article_ids in bucket_ids.items():
+                        self.redis.cache_articles_by_recency(
+                            bucket_name, 
+                            article_ids, 
+                            self.config.recency_cache_ttl,
+                            pipe=pipe
+                        )
+                    
+                    for (bucket_name, article_ids), ok in zip(bucket_ids.items(), pipe.execute()):
+                        # An empty bucket is a DELETE, which succeeds whether or not the key existed
+                        if ok or not article_ids:
+                            results[bucket_name] = len(article_ids)
+                            self.analytics.record_write()
+                        else:
+                            results[bucket_name] = 0
+                
                 logger.info(f"Warmed recency caches: {results}")
                 return results
                 
@@ -293,6 +322,10 @@ class AdvancedCacheManager:
                 
                 sources = result.scalars().all()
                 
+                # Queue every source's metrics on one pipeline
+                pipe = self.redis.client.pipeline(transaction=False)
+                queued_sources = 0
+                
                 for source in sources:
                     try:
                         metrics = {
@@ -306,18 +339,21 @@ class AdvancedCacheManager:
                             'cached_at': datetime.utcnow().isoformat()
                         }
                         
-                        success = self.redis.cache_source_performance(
+                        self.redis.cache_source_performance(
                             int(source.id),  # type: ignore
                             metrics, 
-                            self.config.source_perf_ttl
+                            self.config.source_perf_ttl,
+                            pipe=pipe
                         )
-                        
-                        if success:
-                            cached_sources += 1
-                            self.analytics.record_write()
+                        queued_sources += 1
                             
                     except Exception as e:
                         logger.error(f"Error caching metrics for source {source.id}: {e}")
+                
+                if queued_sources:
+                    cached_sources = sum(1 for ok in pipe.execute() if ok)
+                    for _ in range(cached_sources):
+                        self.analytics.record_write()
             
             logger.info(f"Cached performance metrics for {cached_sources} sources")
             return {'sources_cached': cached_sources}
@@ -408,7 +444,7 @@ class AdvancedCacheManager:
     
     # === CACHE MANAGEMENT & ANALYTICS ===
     
-    async def invalidate_caches_for_new_articles(self, articles: List[Article]) -> Dict[str, int]:
+    async def invalidate_caches_for_new_articles(self, articles: List[ArticleLike]) -> Dict[str, int]:
         """Smart cache invalidation when new articles arrive"""
         try:
             invalidated = {
@@ -485,6 +521,16 @@ class AdvancedCacheManager:
             logger.error(f"Cache warming failed: {e}")
             return {'status': 'failed', 'error': str(e)}
     
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get the cache TTL and warming settings"""
+        return {
+            'content_hash_ttl': self.config.content_hash_ttl,
+            'topic_cache_ttl': self.config.topic_cache_ttl,
+            'recency_cache_ttl': self.config.recency_cache_ttl,
+            'max_articles_per_cache': self.config.max_articles_per_cache,
+            'warming_enabled': self.config.cache_warming_enabled
+        }
+    
     def get_cache_analytics(self) -> Dict[str, Any]:
         """Get comprehensive cache analytics"""
         try:
@@ -494,13 +540,7 @@ class AdvancedCacheManager:
             return {
                 'manager_stats': manager_analytics,
                 'redis_stats': redis_analytics,
-                'cache_config': {
-                    'content_hash_ttl': self.config.content_hash_ttl,
-                    'topic_cache_ttl': self.config.topic_cache_ttl,
-                    'recency_cache_ttl': self.config.recency_cache_ttl,
-                    'max_articles_per_cache': self.config.max_articles_per_cache,
-                    'warming_enabled': self.config.cache_warming_enabled
-                },
+                'cache_config': self.get_cache_config(),
                 'timestamp': datetime.utcnow().isoformat()
             }
             
@@ -567,7 +607,7 @@ async def warm_all_caches() -> Dict[str, Any]:
     """Warm all cache layers"""
     return await cache_manager.warm_all_caches()
 
-async def invalidate_caches_for_articles(articles: List[Article]) -> Dict[str, int]:
+async def invalidate_caches_for_articles(articles: List[ArticleLike]) -> Dict[str, int]:
     """Invalidate caches when new articles arrive"""
     return await cache_manager.invalidate_caches_for_new_articles(articles)
 
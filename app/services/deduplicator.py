@@ -17,11 +17,85 @@ from app.utils.hash_generator import (
     verify_hash_collision,
     calculate_hash_quality_metrics
 )
-from sqlalchemy import select, func, delete, or_, and_
+from sqlalchemy import select, func, delete, or_, and_, text
 from sqlalchemy.exc import IntegrityError
 
 logger = logging.getLogger(__name__)
 
+# Single-pass hash + title deduplication. Scores and title keys mirror
+# ArticleDeduplicator._select_best_article and _normalize_title_for_comparison;
+# only articles that survive the hash pass compete in the title pass, so every
+# duplicate group keeps exactly one article.
+COMBINED_DEDUP_SQL = r"""
+WITH scored AS (
+    SELECT
+        id,
+        content_hash,
+        discovered_at,
+        title,
+        coalesce(source_reliability, 50) / 2.0
+            + CASE
+                WHEN length(coalesce(content, '')) > 1000 THEN 30
+                WHEN length(coalesce(content, '')) > 500 THEN 20
+                WHEN length(coalesce(content, '')) > 200 THEN 10
+                ELSE 0
+              END
+            + coalesce(quality_score, 0) / 100.0 * 20 AS score,
+        regexp_replace(
+            regexp_replace(
+                regexp_replace(lower(title), '^\s+|\s+$', '', 'g'),
+                '^(breaking|exclusive|update|alert):\s*', ''
+            ),
+            '\s*-\s*[^-]+$', ''
+        ) AS stripped_title
+    FROM articles
+    WHERE discovered_at >= :cutoff_date
+),
+keyed AS (
+    SELECT
+        id,
+        content_hash,
+        discovered_at,
+        score,
+        CASE WHEN length(title) >= 15 THEN btrim(regexp_replace(
+            regexp_replace(stripped_title, '[^\w\s]', ' ', 'g'),
+            '\s+', ' ', 'g'
+        )) END AS title_key
+    FROM scored
+),
+hash_ranked AS (
+    SELECT
+        id,
+        discovered_at,
+        score,
+        CASE WHEN length(title_key) >= 10 THEN title_key END AS title_key,
+        ROW_NUMBER() OVER (
+            PARTITION BY content_hash
+            ORDER BY score DESC, discovered_at DESC, id
+        ) AS rn_hash
+    FROM keyed
+),
+title_ranked AS (
+    SELECT
+        id,
+        ROW_NUMBER() OVER (
+            PARTITION BY title_key
+            ORDER BY score DESC, discovered_at DESC, id
+        ) AS rn_title
+    FROM hash_ranked
+    WHERE rn_hash = 1 AND title_key IS NOT NULL
+),
+duplicates AS (
+    SELECT id, TRUE AS hash_duplicate FROM hash_ranked WHERE rn_hash > 1
+    UNION ALL
+    SELECT id, FALSE AS hash_duplicate FROM title_ranked WHERE rn_title > 1
+)
+DELETE FROM articles
+USING duplicates
+WHERE articles.id = duplicates.id
+RETURNING articles.id, duplicates.hash_duplicate
+"""
+
 class ArticleDeduplicator:
     """Standalone article deduplication service"""
     
@@ -114,6 +188,45 @@ class ArticleDeduplicator:
             
             return self._create_stats_response(start_time, f"Hash-based: removed {total_removed} duplicates")
 
+    async def deduplicate_by_hash_and_title(self, days_back: int = 3) -> Dict[str, Any]:
+        """
+        Remove hash and title duplicates in a single DELETE statement
+        
+        Keeps the best-scoring article per content hash, then ranks the survivors
+        by normalized title and keeps the best of each title group, so the recent
+        window is scanned once instead of once per method.
+        
+        Args:
+            days_back: Days to look back for duplicates
+            
+        Returns:
+            Deduplication statistics (with per-method breakdown)
+        """
+        start_time = datetime.utcnow()
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+        
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(
+                text(COMBINED_DEDUP_SQL),
+                {"cutoff_date": cutoff_date}
+            )
+            removed_rows = result.fetchall()
+            await session.commit()
+        
+        hash_removed = sum(1 for row in removed_rows if row.hash_duplicate)
+        title_removed = len(removed_rows) - hash_removed
+        
+        self.duplicates_removed = len(removed_rows)
+        self.duplicates_found = len(removed_rows)
+        
+        stats = self._create_stats_response(
+            start_time,
+            f"Hash + title: removed {len(removed_rows)} duplicates"
+        )
+        stats["hash_duplicates_removed"] = hash_removed
+        stats["title_duplicates_removed"] = title_removed
+        return stats
+
     async def deduplicate_by_title_similarity(
         self, 
         similarity_threshold: float = 0.85,
@@ -433,7 +546,7 @@ async def deduplicate_articles(method: str = "hash", days_back: int = 3) -> Dict
     Deduplicate articles using specified method
     
     Args:
-        method: 'hash', 'title', 'domain', or 'all'
+        method: 'hash', 'title', 'combined', 'domain', or 'all'
         days_back: Days to look back
         
     Returns:
@@ -445,6 +558,8 @@ async def deduplicate_articles(method: str = "hash", days_back: int = 3) -> Dict
         return await deduplicator.deduplicate_by_content_hash(days_back)
     elif method == "title":
         return await deduplicator.deduplicate_by_title_similarity(days_back=days_back)
+    elif method == "combined":
+        return await deduplicator.deduplicate_by_hash_and_title(days_back)
     elif method == "domain":
         return await deduplicator.deduplicate_by_url_domain(days_back)
     elif method == "all":
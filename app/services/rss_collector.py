@@ -15,7 +15,7 @@ import logging
 from app.models.source import NewsSource
 from app.models.article import Article
 from app.database import AsyncSessionLocal
-from app.utils.date_parser import parse_rss_date
+from app.utils.date_parser import parse_rss_date, parse_struct_time
 from app.utils.text_cleaner import TextCleaner
 from app.config import settings
 from sqlalchemy import select, func, text
@@ -504,6 +504,15 @@ class RSSCollector:
 
     def _extract_entry_date(self, entry: Any) -> Optional[datetime]:
         """Extract publication date from RSS entry"""
+        # Prefer feedparser's pre-parsed UTC struct_time - no string parsing
+        for field in ['published_parsed', 'updated_parsed', 'created_parsed']:
+            time_struct = getattr(entry, field, None)
+            if time_struct:
+                parsed_date = parse_struct_time(time_struct)
+                if parsed_date:
+                    return parsed_date
+        
+        # Fall back to parsing raw date strings
         date_fields = ['published', 'updated', 'created', 'pubDate']
         
         for field in date_fields:
@@ -513,16 +522,6 @@ class RSSCollector:
                 if parsed_date:
                     return parsed_date
         
-        # Try structured time fields
-        for field in ['published_parsed', 'updated_parsed']:
-            if hasattr(entry, field):
-                time_struct = getattr(entry, field)
-                if time_struct:
-                    try:
-                        return datetime(*time_struct[:6]).replace(tzinfo=None)
-                    except (ValueError, TypeError):
-                        continue
-        
         return None
     
     def _generate_content_hash(self, title: str, url: str, content: str) -> str:
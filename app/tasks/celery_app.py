@@ -57,7 +57,9 @@ def create_celery_app() -> Celery:
             Queue('maintenance', routing_key='maintenance'),
         ),
         
-        # Worker settings
+        # Worker settings - fair scheduling for long-running I/O tasks: each
+        # worker slot reserves one message and acks it only after completion,
+        # so a long collection run can't hoard maintenance/health-check tasks
         worker_prefetch_multiplier=1,
         task_acks_late=True,
         worker_max_tasks_per_child=1000,
@@ -1,12 +1,12 @@
 """
 Background tasks for RSS collection, content processing, and maintenance
 Integrates with existing RSSCollector, ContentProcessor, and ArticleDeduplicator
-FIXED: Asyncio event loop conflicts resolved for Celery workers
+NATIVE ASYNC: Tasks are coroutines executed by the AsyncIOPool worker pool
 ENHANCED: Advanced multi-layer caching integration for Priority 2
 """
 
 import asyncio
-import nest_asyncio
+import orjson
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import logging
@@ -20,10 +20,10 @@ from app.utils.redis_client import get_redis_client
 from app.database import AsyncSessionLocal
 from app.models.source import NewsSource
 from app.models.article import Article
-from sqlalchemy import select, func
+from sqlalchemy import select, func, update
 
 # ENHANCED: Advanced caching integration
-from app.services.cache_manager import cache_manager, invalidate_caches_for_articles
+from app.services.cache_manager import cache_manager, invalidate_caches_for_articles, ARTICLE_CACHE_COLUMNS
 
 
 logger = logging.getLogger(__name__)
@@ -45,33 +45,8 @@ class CallbackTask(Task):
         logger.warning(f"Task {self.name} [{task_id}] retrying: {exc}")
 
 
-def run_async_safely(coro):
-    """
-    Safely run async coroutine in Celery worker context - FIXED VERSION
-    Handles event loop conflicts between Celery and asyncio
-    """
-    try:
-        # Apply nest_asyncio to allow nested loops
-        import nest_asyncio
-        nest_asyncio.apply()
-        
-        # Get or create event loop
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        # Use nest_asyncio's patched run_until_complete
-        return loop.run_until_complete(coro)
-        
-    except Exception as e:
-        logger.error(f"run_async_safely failed: {e}")
-        raise
-
-
 @celery_app.task(bind=True, base=CallbackTask, name='app.tasks.rss_tasks.collect_all_rss_sources')
-def collect_all_rss_sources(self, max_concurrent: int = 5) -> Dict[str, Any]:
+async def collect_all_rss_sources(self, max_concurrent: int = 5) -> Dict[str, Any]:
     """
     Scheduled task: Collect articles from all RSS sources with advanced caching
     Runs every 15 minutes via Celery Beat
@@ -81,13 +56,13 @@ def collect_all_rss_sources(self, max_concurrent: int = 5) -> Dict[str, Any]:
     logger.info(f"Starting RSS collection task - ID: {self.request.id}")
     
     try:
-        # Run async RSS collection with safe event loop handling
-        stats = run_async_safely(collect_rss_articles(max_concurrent=max_concurrent))
+        # Run async RSS collection
+        stats = await collect_rss_articles(max_concurrent=max_concurrent)
         
         # Cache results in Redis (existing functionality)
         cache_key = f"rss_collection:{task_start.strftime('%Y%m%d_%H%M')}"
         redis_client = get_redis_client()
-        redis_client.setex(cache_key, 3600, str(stats))  # Cache for 1 hour
+        redis_client.setex(cache_key, 3600, orjson.dumps(stats, default=str))  # Cache for 1 hour
         
         # ENHANCED: Advanced caching integration
         if stats['articles_collected'] > 0:
@@ -95,36 +70,37 @@ def collect_all_rss_sources(self, max_concurrent: int = 5) -> Dict[str, Any]:
             async def _get_new_articles():
                 async with AsyncSessionLocal() as session:
                     result = await session.execute(
-                        select(Article)
+                        select(*ARTICLE_CACHE_COLUMNS)
                         .filter(Article.discovered_at >= task_start)
                         .limit(stats['articles_collected'])
                     )
-                    return list(result.scalars().all())
+                    return list(result.all())
             
             # Get new articles and handle caching
-            new_articles = run_async_safely(_get_new_articles())
+            new_articles = await _get_new_articles()
             
             if new_articles:
                 # Smart cache invalidation for new articles
-                invalidation_stats = run_async_safely(invalidate_caches_for_articles(new_articles))
+                invalidation_stats = await invalidate_caches_for_articles(new_articles)
                 stats['cache_invalidation'] = invalidation_stats
                 logger.info(f"Cache invalidation completed: {invalidation_stats}")
                 
                 # Cache new articles by hash for fast deduplication
                 cached_articles = 0
                 for article in new_articles:
-                    if run_async_safely(cache_manager.cache_article_by_hash(article)):
+                    if await cache_manager.cache_article_by_hash(article):
                         cached_articles += 1
                 
                 stats['articles_cached_by_hash'] = cached_articles
             
             # Warm all cache layers with new content
-            cache_warming_stats = run_async_safely(cache_manager.warm_all_caches())
+            cache_warming_stats = await cache_manager.warm_all_caches()
             stats['cache_warming'] = cache_warming_stats
             logger.info(f"Cache warming completed: {cache_warming_stats}")
             
-            # Schedule content processing
-            process_articles_background.apply_async(countdown=300)  # Process in 5 minutes
+            # Dispatch content processing now (no ETA held in worker prefetch);
+            # drop it if not picked up before the next scheduled processing run
+            process_articles_background.apply_async(queue='content_processing', expires=1800)
         
         # Log results
         processing_time = (datetime.utcnow() - task_start).total_seconds()
@@ -133,16 +109,16 @@ def collect_all_rss_sources(self, max_concurrent: int = 5) -> Dict[str, Any]:
             f"Articles: {stats['articles_collected']}, Time: {processing_time:.2f}s"
         )
         
-        # ENHANCED: Include cache performance metrics
-        cache_analytics = cache_manager.get_cache_analytics()
+        # ENHANCED: Include cache performance metrics (periodic snapshot)
+        cache_summary = await asyncio.to_thread(get_cache_performance_summary)
         
         return {
             **stats,
             'task_id': self.request.id,
             'processing_time_seconds': processing_time,
             'scheduled_content_processing': stats['articles_collected'] > 0,
-            'cache_analytics': cache_analytics.get('manager_stats', {}),
-            'redis_analytics': cache_analytics.get('redis_stats', {})
+            'cache_analytics': cache_summary.get('cache_manager_stats', {}),
+            'redis_analytics': cache_summary.get('redis_stats', {})
         }
         
     except Exception as exc:
@@ -152,7 +128,7 @@ def collect_all_rss_sources(self, max_concurrent: int = 5) -> Dict[str, Any]:
 
 
 @celery_app.task(bind=True, base=CallbackTask, name='app.tasks.rss_tasks.collect_single_source')
-def collect_single_source(self, source_id: int) -> Dict[str, Any]:
+async def collect_single_source(self, source_id: int) -> Dict[str, Any]:
     """
     Collect articles from a single RSS source
     Used for priority sources or manual triggers
@@ -188,7 +164,7 @@ def collect_single_source(self, source_id: int) -> Dict[str, Any]:
                 
                 return collection_result
         
-        result = run_async_safely(_collect_single())
+        result = await _collect_single()
         
         logger.info(f"Single source collection completed: {result}")
         return result
@@ -199,7 +175,7 @@ def collect_single_source(self, source_id: int) -> Dict[str, Any]:
 
 
 @celery_app.task(bind=True, base=CallbackTask, name='app.tasks.rss_tasks.process_articles_background')
-def process_articles_background(self, batch_size: int = 50) -> Dict[str, Any]:
+async def process_articles_background(self, batch_size: int = 50) -> Dict[str, Any]:
     """
     Background content processing task - FIXED VERSION
     Enhances articles with metadata and deduplication
@@ -208,17 +184,17 @@ def process_articles_background(self, batch_size: int = 50) -> Dict[str, Any]:
     logger.info("Starting background content processing")
     
     try:
-        # Run content processing with safe event loop handling
-        stats = run_async_safely(process_articles())
+        # Run content processing
+        stats = await process_articles()
         
         # ENHANCED: Refresh caches after content processing
         if stats.get('articles_processed', 0) > 0:
             # Warm topic caches with newly processed articles
-            topic_warming_stats = run_async_safely(cache_manager.warm_topic_caches())
+            topic_warming_stats = await cache_manager.warm_topic_caches()
             stats['topic_cache_warming'] = topic_warming_stats
             
             # Update source performance cache with processing stats
-            source_perf_stats = run_async_safely(cache_manager.cache_source_performance_metrics())
+            source_perf_stats = await cache_manager.cache_source_performance_metrics()
             stats['source_performance_caching'] = source_perf_stats
         
         logger.info(
@@ -237,7 +213,7 @@ def process_articles_background(self, batch_size: int = 50) -> Dict[str, Any]:
 
 
 @celery_app.task(bind=True, base=CallbackTask, name='app.tasks.rss_tasks.deduplicate_articles_background')
-def deduplicate_articles_background(self, days_back: int = 3) -> Dict[str, Any]:
+async def deduplicate_articles_background(self, days_back: int = 3) -> Dict[str, Any]:
     """
     Background deduplication task
     Runs daily to clean up duplicate articles
@@ -246,32 +222,23 @@ def deduplicate_articles_background(self, days_back: int = 3) -> Dict[str, Any]:
     logger.info(f"Starting background deduplication (last {days_back} days)")
     
     try:
-        async def _run_deduplication():
-            # Run hash-based deduplication
-            hash_stats = await deduplicate_articles("hash", days_back=days_back)
-            
-            # Run title similarity deduplication
-            title_stats = await deduplicate_articles("title", days_back=days_back)
-            
-            return hash_stats, title_stats
-        
-        # Run with safe event loop handling
-        hash_stats, title_stats = run_async_safely(_run_deduplication())
+        # Hash and title deduplication in a single DB statement
+        dedup_stats = await deduplicate_articles("combined", days_back=days_back)
         
-        total_removed = hash_stats['duplicates_removed'] + title_stats['duplicates_removed']
+        total_removed = dedup_stats['duplicates_removed']
         
         # ENHANCED: Invalidate caches after deduplication
         if total_removed > 0:
             # Refresh all cache layers since articles were removed
-            cache_refresh_stats = run_async_safely(cache_manager.warm_all_caches())
+            cache_refresh_stats = await cache_manager.warm_all_caches()
             logger.info(f"Cache refresh after deduplication: {cache_refresh_stats}")
         
         logger.info(f"Deduplication completed - Removed: {total_removed} duplicates")
         
         return {
             'total_duplicates_removed': total_removed,
-            'hash_based_removed': hash_stats['duplicates_removed'],
-            'title_similarity_removed': title_stats['duplicates_removed'],
+            'hash_based_removed': dedup_stats['hash_duplicates_removed'],
+            'title_similarity_removed': dedup_stats['title_duplicates_removed'],
             'task_id': self.request.id,
             'cache_refresh_triggered': total_removed > 0
         }
@@ -282,7 +249,7 @@ def deduplicate_articles_background(self, days_back: int = 3) -> Dict[str, Any]:
 
 
 @celery_app.task(bind=True, base=CallbackTask, name='app.tasks.rss_tasks.health_check_sources')
-def health_check_sources(self) -> Dict[str, Any]:
+async def health_check_sources(self) -> Dict[str, Any]:
     """
     Health check task for RSS sources
     Monitors source performance and enables/disables sources
@@ -293,33 +260,44 @@ def health_check_sources(self) -> Dict[str, Any]:
     try:
         async def _health_check():
             async with AsyncSessionLocal() as session:
-                # Get sources with high failure rates
+                # Compute failure rates in SQL - no ORM hydration
+                failure_rate = (
+                    func.coalesce(NewsSource.failed_polls, 0) * 1.0
+                    / func.greatest(func.coalesce(NewsSource.total_polls, 1), 1)
+                ).label('failure_rate')
+                
                 result = await session.execute(
-                    select(NewsSource)
+                    select(NewsSource.id, NewsSource.name, failure_rate, NewsSource.consecutive_failures)
                     .filter(NewsSource.enabled.is_(True))  # type: ignore[attr-defined]
                 )
-                sources = list(result.scalars().all())
+                rows = result.all()
                 
                 health_report = {
-                    'total_sources': len(sources),
+                    'total_sources': len(rows),
                     'healthy_sources': 0,
                     'problematic_sources': 0,
                     'disabled_sources': 0
                 }
                 
-                for source in sources:
-                    failure_rate = (getattr(source, 'failed_polls', 0) or 0) / max(getattr(source, 'total_polls', 1) or 1, 1)
-                    
-                    if failure_rate > 0.7 and bool(source.consecutive_failures >= 5):
-                        # Disable problematic source
-                        source.enabled = False
+                to_disable = []
+                for source_id, source_name, source_failure_rate, consecutive_failures in rows:
+                    if source_failure_rate > 0.7 and (consecutive_failures or 0) >= 5:
+                        # Disable problematic source (batched below)
+                        to_disable.append(source_id)
                         health_report['disabled_sources'] += 1
-                        logger.warning(f"Disabled problematic source: {source.name}")
-                    elif failure_rate > 0.5:
+                        logger.warning(f"Disabled problematic source: {source_name}")
+                    elif source_failure_rate > 0.5:
                         health_report['problematic_sources'] += 1
                     else:
                         health_report['healthy_sources'] += 1
                 
+                if to_disable:
+                    await session.execute(
+                        update(NewsSource)
+                        .where(NewsSource.id.in_(to_disable))
+                        .values(enabled=False)
+                    )
+                
                 await session.commit()
                 
                 # ENHANCED: Update source performance cache after health check
@@ -327,7 +305,7 @@ def health_check_sources(self) -> Dict[str, Any]:
                 
                 return health_report
         
-        health_report = run_async_safely(_health_check())
+        health_report = await _health_check()
         
         logger.info(f"Health check completed: {health_report}")
         return health_report
@@ -338,7 +316,7 @@ def health_check_sources(self) -> Dict[str, Any]:
 
 
 @celery_app.task(bind=True, base=CallbackTask)
-def manual_source_trigger(self, source_names: List[str]) -> Dict[str, Any]:
+async def manual_source_trigger(self, source_names: List[str], max_concurrent: int = 5) -> Dict[str, Any]:
     """
     Manually trigger collection for specific sources
     Useful for high-priority sources or debugging
@@ -347,37 +325,62 @@ def manual_source_trigger(self, source_names: List[str]) -> Dict[str, Any]:
     logger.info(f"Manual trigger for sources: {source_names}")
     
     try:
-        async def _manual_collect():
-            results = []
-            collected_articles = []
-            
-            async with AsyncSessionLocal() as session:
-                for source_name in source_names:
+        async def _collect_one(source_name: str, semaphore: asyncio.Semaphore):
+            # One session per coroutine - AsyncSession must not be shared across gather tasks
+            async with semaphore:
+                async with AsyncSessionLocal() as session:
                     result = await session.execute(
                         select(NewsSource).filter(NewsSource.name == source_name)
                     )
                     source = result.scalar_one_or_none()
                     
-                    if source:
-                        async with RSSCollector() as collector:
-                            source_result = await collector._collect_from_source(source)
-                            results.append(source_result)
-                            
-                            # ENHANCED: Get collected articles for caching
-                            if source_result.get('articles_collected', 0) > 0:
-                                articles_result = await session.execute(
-                                    select(Article)
-                                    .filter(Article.source_name == source_name)
-                                    .order_by(Article.discovered_at.desc())
-                                    .limit(source_result['articles_collected'])
-                                )
-                                collected_articles.extend(list(articles_result.scalars().all()))
-                    else:
-                        results.append({
+                    if not source:
+                        return {
                             'source_name': source_name,
                             'error': 'Source not found',
                             'articles_collected': 0
-                        })
+                        }, []
+                    
+                    async with RSSCollector() as collector:
+                        source_result = await collector._collect_from_source(source)
+                    
+                    # ENHANCED: Get collected articles for caching
+                    articles = []
+                    if source_result.get('articles_collected', 0) > 0:
+                        articles_result = await session.execute(
+                            select(*ARTICLE_CACHE_COLUMNS)
+                            .filter(Article.source_name == source_name)
+                            .order_by(Article.discovered_at.desc())
+                            .limit(source_result['articles_collected'])
+                        )
+                        articles = articles_result.all()
+                    
+                    return source_result, articles
+        
+        async def _manual_collect():
+            results = []
+            collected_articles = []
+            
+            # Fan out across sources - latency is max-of-sources, not sum
+            semaphore = asyncio.Semaphore(max_concurrent)
+            outcomes = await asyncio.gather(
+                *(_collect_one(name, semaphore) for name in source_names),
+                return_exceptions=True
+            )
+            
+            for source_name, outcome in zip(source_names, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Manual collection failed for {source_name}: {outcome}")
+                    results.append({
+                        'source_name': source_name,
+                        'error': str(outcome),
+                        'articles_collected': 0
+                    })
+                    continue
+                
+                source_result, articles = outcome
+                results.append(source_result)
+                collected_articles.extend(articles)
             
             # ENHANCED: Cache management for manually triggered sources
             if collected_articles:
@@ -397,7 +400,7 @@ def manual_source_trigger(self, source_names: List[str]) -> Dict[str, Any]:
             
             return results, {}
         
-        results, cache_stats = run_async_safely(_manual_collect())
+        results, cache_stats = await _manual_collect()
         
         total_articles = sum(r.get('articles_collected', 0) for r in results)
         logger.info(f"Manual collection completed - Total articles: {total_articles}")
@@ -416,7 +419,7 @@ def manual_source_trigger(self, source_names: List[str]) -> Dict[str, Any]:
 
 # ENHANCED: New cache management tasks
 @celery_app.task(bind=True, base=CallbackTask, name='app.tasks.rss_tasks.warm_cache_layers')
-def warm_cache_layers(self, layers: List[str] = []) -> Dict[str, Any]:
+async def warm_cache_layers(self, layers: List[str] = []) -> Dict[str, Any]:
     """
     Manually warm specific cache layers
     Useful for cache management and performance optimization
@@ -426,17 +429,17 @@ def warm_cache_layers(self, layers: List[str] = []) -> Dict[str, Any]:
     try:
         if not layers:
             # Warm all caches
-            warming_stats = run_async_safely(cache_manager.warm_all_caches())
+            warming_stats = await cache_manager.warm_all_caches()
         else:
             # Warm specific layers
             warming_stats = {}
             for layer in layers:
                 if layer == 'topics':
-                    warming_stats['topics'] = run_async_safely(cache_manager.warm_topic_caches())
+                    warming_stats['topics'] = await cache_manager.warm_topic_caches()
                 elif layer == 'recency':
-                    warming_stats['recency'] = run_async_safely(cache_manager.warm_recency_caches())
+                    warming_stats['recency'] = await cache_manager.warm_recency_caches()
                 elif layer == 'source_performance':
-                    warming_stats['source_performance'] = run_async_safely(cache_manager.cache_source_performance_metrics())
+                    warming_stats['source_performance'] = await cache_manager.cache_source_performance_metrics()
         
         logger.info(f"Cache warming completed: {warming_stats}")
         return {
@@ -484,18 +487,43 @@ def get_active_tasks() -> List[Dict[str, Any]]:
 
 
 # ENHANCED: Cache monitoring utilities
+# Redis-side stats (INFO, key counts, health) are shared by every process, so they
+# are snapshotted in Redis and rebuilt at most once a minute, on demand.
+# Hit/miss counters live in each process and are always read live.
+CACHE_SUMMARY_KEY = 'analytics:redis_summary'
+CACHE_SUMMARY_MAX_AGE_SECONDS = 60
+
+
+def _build_redis_summary() -> Dict[str, Any]:
+    """Build a fresh Redis-side summary (INFO, key counts, health) and store it"""
+    redis_client = get_redis_client()
+    summary = {
+        'redis_stats': redis_client.get_cache_analytics(),
+        'redis_health': redis_client.health_check(),
+        'timestamp': datetime.utcnow().isoformat()
+    }
+    if 'error' not in summary['redis_stats']:
+        redis_client.set_json(CACHE_SUMMARY_KEY, summary, ex=CACHE_SUMMARY_MAX_AGE_SECONDS)
+    return summary
+
+
 def get_cache_performance_summary() -> Dict[str, Any]:
-    """Get comprehensive cache performance summary"""
+    """
+    Get comprehensive cache performance summary
+    Redis-side stats come from the shared snapshot (rebuilt when expired);
+    cache manager stats are this process's live counters
+    """
     try:
-        analytics = cache_manager.get_cache_analytics()
         redis_client = get_redis_client()
+        summary = redis_client.get_json(CACHE_SUMMARY_KEY) or _build_redis_summary()
         
         return {
-            'cache_manager_stats': analytics.get('manager_stats', {}),
-            'redis_stats': analytics.get('redis_stats', {}),
-            'cache_config': analytics.get('cache_config', {}),
-            'redis_health': redis_client.health_check(),
-            'timestamp': datetime.utcnow().isoformat()
+            'cache_manager_stats': cache_manager.analytics.get_stats(),
+            # The L1 article cache is per process too, so its counters are read live
+            'redis_stats': {**summary.get('redis_stats', {}), 'l1_article_cache': redis_client.get_l1_stats()},
+            'cache_config': cache_manager.get_cache_config(),
+            'redis_health': summary.get('redis_health', {}),
+            'timestamp': summary.get('timestamp')
         }
     except Exception as e:
         logger.error(f"Error getting cache performance summary: {e}")
@@ -5,13 +5,25 @@ Handles multiple date formats from different sources
 
 import re
 from datetime import datetime, timezone, timedelta
-from typing import Optional, Union
+from typing import Any, Optional, Union
 from dateutil import parser as dateutil_parser
 import pytz
 import logging
 
 logger = logging.getLogger(__name__)
 
+_ZERO_OFFSET = timedelta(0)
+
+# Precompiled patterns for DateParser._clean_date_string
+_WHITESPACE_RE = re.compile(r'\s+')
+_DOUBLE_TZ_RE = re.compile(r'\s+(GMT|UTC)\s*([+-]\d{4})')
+_TZ_TAIL_RE = re.compile(r'(?:\s*(GMT|UTC)|\s+(IST))\s*$')
+_TZ_TAIL_OFFSETS = {'GMT': ' +0000', 'UTC': ' +0000', 'IST': ' +0530'}
+
+def _replace_tz_tail(match: re.Match) -> str:
+    """Map a trailing timezone abbreviation to its numeric offset"""
+    return _TZ_TAIL_OFFSETS[match.group(1) or match.group(2)]
+
 class DateParser:
     """Robust date parser for RSS feed timestamps"""
     
@@ -50,6 +62,9 @@ class DateParser:
         'MST': 'US/Mountain'
     }
     
+    # No legitimate RSS date is longer than this; bounds worst-case parse cost
+    MAX_DATE_LENGTH = 64
+    
     @classmethod
     def parse_rss_date(cls, date_string: Union[str, None]) -> Optional[datetime]:
         """
@@ -64,13 +79,14 @@ class DateParser:
         if not date_string or not isinstance(date_string, str):
             return None
             
-        date_string = date_string.strip()
+        date_string = date_string.strip()[:cls.MAX_DATE_LENGTH]
         if not date_string:
             return None
         
         # Try different parsing methods in order of preference
         parsed_date = (
             cls._try_dateutil_parser(date_string) or
+            cls._try_fuzzy_parsing(date_string) or
             cls._try_pattern_matching(date_string) or
             cls._try_manual_parsing(date_string) or
             cls._try_fallback_parsing(date_string)
@@ -90,11 +106,11 @@ class DateParser:
             # Clean up common RSS date format issues
             cleaned = cls._clean_date_string(date_string)
             
-            # Parse with dateutil
-            parsed = dateutil_parser.parse(cleaned, fuzzy=True)
+            # Parse with dateutil (strict - fuzzy disables its fast paths)
+            parsed = dateutil_parser.parse(cleaned, fuzzy=False)
             return parsed
             
-        except (ValueError, TypeError, AttributeError) as e:
+        except (ValueError, TypeError, AttributeError, OverflowError) as e:
             logger.debug(f"dateutil parsing failed for '{date_string}': {e}")
             return None
     
@@ -177,24 +193,29 @@ class DateParser:
         
         return None
     
+    @classmethod
+    def _try_fuzzy_parsing(cls, date_string: str) -> Optional[datetime]:
+        """Fuzzy dateutil parsing (input already bounded to MAX_DATE_LENGTH)"""
+        try:
+            cleaned = cls._clean_date_string(date_string)
+            return dateutil_parser.parse(cleaned, fuzzy=True)
+            
+        except (ValueError, TypeError, AttributeError, OverflowError) as e:
+            logger.debug(f"Fuzzy parsing failed for '{date_string}': {e}")
+            return None
+    
     @classmethod
     def _clean_date_string(cls, date_string: str) -> str:
         """Clean up date string for parsing"""
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', date_string.strip())
+        cleaned = _WHITESPACE_RE.sub(' ', date_string.strip())
         
         # Fix common RSS date issues
         # Replace double timezone indicators
-        cleaned = re.sub(r'\s+(GMT|UTC)\s*([+-]\d{4})', r' \2', cleaned)
+        cleaned = _DOUBLE_TZ_RE.sub(r' \2', cleaned)
         
-        # Standardize timezone format
-        cleaned = re.sub(r'\s*GMT\s*$', ' +0000', cleaned)
-        cleaned = re.sub(r'\s*UTC\s*$', ' +0000', cleaned)
-        
-        # Fix IST timezone
-        cleaned = re.sub(r'\s+IST\s*$', ' +0530', cleaned)
-        
-        return cleaned
+        # Standardize trailing GMT/UTC/IST to numeric offsets in one pass
+        return _TZ_TAIL_RE.sub(_replace_tz_tail, cleaned)
     
     @classmethod
     def _normalize_to_utc(cls, dt: datetime) -> datetime:
@@ -203,9 +224,23 @@ class DateParser:
             # Assume UTC for naive datetime
             return dt.replace(tzinfo=timezone.utc)
         
+        # Fast path: already UTC (most feeds after normalization)
+        if dt.tzinfo is timezone.utc:
+            return dt
+        if dt.utcoffset() == _ZERO_OFFSET:
+            return dt.replace(tzinfo=timezone.utc)
+        
         # Convert to UTC
         return dt.astimezone(timezone.utc)
     
+    @classmethod
+    def from_struct_time(cls, time_struct: Any) -> Optional[datetime]:
+        """Build UTC datetime from feedparser's pre-parsed struct_time (already UTC)"""
+        try:
+            return datetime(*time_struct[:6], tzinfo=timezone.utc)
+        except (ValueError, TypeError):
+            return None
+    
     @classmethod
     def format_for_database(cls, dt: Optional[datetime]) -> Optional[datetime]:
         """Format datetime for database storage (ensure UTC)"""
@@ -228,6 +263,10 @@ def format_for_database(dt: Optional[datetime]) -> Optional[datetime]:
     """Format datetime for database storage"""
     return DateParser.format_for_database(dt)
 
+def parse_struct_time(time_struct: Any) -> Optional[datetime]:
+    """Convert feedparser *_parsed struct_time to UTC datetime"""
+    return DateParser.from_struct_time(time_struct)
+
 # Test cases for validation
 if __name__ == "__main__":
     test_dates = [
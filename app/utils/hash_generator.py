@@ -5,11 +5,35 @@ Generates unique hashes used by both ContentProcessor and standalone Deduplicato
 
 import hashlib
 import re
+import xxhash
+from collections import Counter
+from functools import lru_cache
 from typing import Optional, Dict, Any, List
 import logging
 
+from app.config import settings
+
 logger = logging.getLogger(__name__)
 
+# hashlib.sha256 only reaches the SHA-NI accelerated path when backed by OpenSSL
+_SHA256_BACKEND = getattr(hashlib.sha256, '__name__', '')
+if _SHA256_BACKEND != 'openssl_sha256':
+    logger.info(f"hashlib.sha256 is not OpenSSL-backed ({_SHA256_BACKEND}); sha256 similarity hashes use the builtin fallback")
+
+# Precompiled patterns for the per-article normalization hot path
+_WS_RE = re.compile(r'\s+')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_QUERY_RE = re.compile(r'[?#].*$')
+_HTML_RE = re.compile(r'<[^>]+>')
+_PREFIX_RE = re.compile(r'^(breaking|exclusive|update):\s*')
+_TRACKING_RE = re.compile(r'[?&](?:utm_source|utm_medium|utm_campaign|ref|source)=[^&]*')
+
+# Deletes exactly the ASCII characters _PUNCT_RE strips, in one C-level translate pass
+_ASCII_PUNCT_TABLE = {c: None for c in range(128) if _PUNCT_RE.match(chr(c))}
+
+# Very common stop words that add noise to title hashes
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
 def generate_content_hash(title: str, url: str, content: str = "") -> str:
     """
     Generate unique hash for article deduplication
@@ -20,7 +44,7 @@ def generate_content_hash(title: str, url: str, content: str = "") -> str:
         content: Article content (optional, primarily use title + URL)
         
     Returns:
-        MD5 hash string for deduplication
+        128-bit xxHash3 hex string (32 chars) for deduplication
     """
     # Normalize inputs for consistent hashing
     title_normalized = normalize_text_for_hash(title or "")
@@ -29,15 +53,15 @@ def generate_content_hash(title: str, url: str, content: str = "") -> str:
     # Primary hash based on title + URL (most reliable for deduplication)
     hash_input = f"{title_normalized}||{url_normalized}"
     
-    return hashlib.md5(hash_input.encode('utf-8')).hexdigest()
+    return xxhash.xxh3_128_hexdigest(hash_input.encode('utf-8'))
 
-def generate_similarity_hash(content: str, algorithm: str = "sha256") -> str:
+def generate_similarity_hash(content: str, algorithm: str = "xxhash") -> str:
     """
     Generate hash for content similarity detection
     
     Args:
         content: Article content
-        algorithm: Hash algorithm ('md5', 'sha256')
+        algorithm: Hash algorithm ('xxhash', 'md5', 'sha256')
         
     Returns:
         Content similarity hash
@@ -48,11 +72,13 @@ def generate_similarity_hash(content: str, algorithm: str = "sha256") -> str:
     # Normalize content for similarity detection
     normalized = normalize_content_for_similarity(content)
     
-    # Generate hash based on algorithm
-    if algorithm == "md5":
+    # Generate hash based on algorithm (xxh32 natively yields the 8-char width)
+    if algorithm == "xxhash":
+        return xxhash.xxh32_hexdigest(normalized.encode('utf-8'))
+    elif algorithm == "md5":
         return hashlib.md5(normalized.encode('utf-8')).hexdigest()[:8]
     else:
-        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:8]
+        return hashlib.sha256(normalized.encode('utf-8')).digest()[:4].hex()
 
 def generate_url_hash(url: str) -> str:
     """
@@ -68,8 +94,9 @@ def generate_url_hash(url: str) -> str:
         return ""
     
     normalized_url = normalize_url_for_hash(url)
-    return hashlib.md5(normalized_url.encode('utf-8')).hexdigest()
+    return xxhash.xxh3_128_hexdigest(normalized_url.encode('utf-8'))
 
+@lru_cache(maxsize=settings.HASH_NORMALIZER_CACHE_SIZE)
 def normalize_text_for_hash(text: str) -> str:
     """
     Normalize text for consistent hashing
@@ -83,22 +110,18 @@ def normalize_text_for_hash(text: str) -> str:
     if not text:
         return ""
     
-    # Basic normalization
-    normalized = text.lower().strip()
-    
-    # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = text.lower()
     
-    # Remove common punctuation that doesn't affect meaning
-    normalized = re.sub(r'[^\w\s]', '', normalized)
-    
-    # Remove very common stop words that add noise
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-    words = normalized.split()
-    meaningful_words = [word for word in words if word not in stop_words and len(word) > 2]
+    # Remove common punctuation that doesn't affect meaning (regex only needed for non-ASCII)
+    if normalized.isascii():
+        normalized = normalized.translate(_ASCII_PUNCT_TABLE)
+    else:
+        normalized = _PUNCT_RE.sub('', normalized)
     
-    return ' '.join(meaningful_words)
+    # split() collapses whitespace; remove very common stop words that add noise
+    return ' '.join(w for w in normalized.split() if len(w) > 2 and w not in STOP_WORDS)
 
+@lru_cache(maxsize=settings.HASH_NORMALIZER_CACHE_SIZE)
 def normalize_url_for_hash(url: str) -> str:
     """
     Normalize URL for consistent hashing
@@ -116,15 +139,13 @@ def normalize_url_for_hash(url: str) -> str:
     normalized = url.strip().lower()
     
     # Remove query parameters and fragments for better deduplication
-    normalized = re.sub(r'[?#].*$', '', normalized)
+    normalized = _QUERY_RE.sub('', normalized)
     
     # Remove trailing slashes
     normalized = normalized.rstrip('/')
     
     # Remove common tracking parameters
-    tracking_params = ['utm_source', 'utm_medium', 'utm_campaign', 'ref', 'source']
-    for param in tracking_params:
-        normalized = re.sub(f'[?&]{param}=[^&]*', '', normalized)
+    normalized = _TRACKING_RE.sub('', normalized)
     
     return normalized
 
@@ -145,13 +166,13 @@ def normalize_content_for_similarity(content: str) -> str:
     text_sample = content[:1000].lower()
     
     # Remove HTML tags if any remain
-    text_sample = re.sub(r'<[^>]+>', '', text_sample)
+    text_sample = _HTML_RE.sub('', text_sample)
     
     # Remove extra whitespace and normalize
-    text_sample = re.sub(r'\s+', ' ', text_sample).strip()
+    text_sample = _WS_RE.sub(' ', text_sample).strip()
     
     # Remove common article prefixes
-    text_sample = re.sub(r'^(breaking|exclusive|update):\s*', '', text_sample)
+    text_sample = _PREFIX_RE.sub('', text_sample)
     
     return text_sample
 
@@ -165,6 +186,15 @@ def generate_batch_hashes(articles_data: List[Dict[str, Any]]) -> Dict[int, str]
     Returns:
         Dictionary mapping article index to content hash
     """
+    try:
+        # Fast path: one pass over the whole batch
+        return dict(enumerate(generate_batch_hashes_fast(
+            [article_data.get('title', '') for article_data in articles_data],
+            [article_data.get('url', '') for article_data in articles_data]
+        )))
+    except Exception as e:
+        logger.warning(f"Batch hash fast path failed, hashing individually: {e}")
+    
     hashes = {}
     
     for i, article_data in enumerate(articles_data):
@@ -181,6 +211,26 @@ def generate_batch_hashes(articles_data: List[Dict[str, Any]]) -> Dict[int, str]
     
     return hashes
 
+def generate_batch_hashes_fast(titles: List[str], urls: List[str]) -> List[str]:
+    """
+    Generate content hashes for parallel title/URL lists in a single tight loop
+    
+    Args:
+        titles: Article titles
+        urls: Article URLs (same length and order as titles)
+        
+    Returns:
+        List of content hashes, identical to generate_content_hash per pair
+    """
+    normalize_title = normalize_text_for_hash
+    normalize_url = normalize_url_for_hash
+    hexdigest = xxhash.xxh3_128_hexdigest
+    
+    return [
+        hexdigest(f"{normalize_title(title or '')}||{normalize_url(url or '')}".encode('utf-8'))
+        for title, url in zip(titles, urls)
+    ]
+
 def verify_hash_collision(hash1: str, hash2: str) -> bool:
     """
     Check if two hashes indicate potential collision
@@ -207,14 +257,11 @@ def calculate_hash_quality_metrics(hashes: List[str]) -> Dict[str, Any]:
     if not hashes:
         return {"total_hashes": 0, "unique_hashes": 0, "collision_rate": 0.0}
     
-    valid_hashes = [h for h in hashes if h and len(h) == 32]  # MD5 length
+    valid_hashes = [h for h in hashes if h and len(h) == 32]  # 128-bit hex length
     unique_hashes = set(valid_hashes)
     
     # Calculate prefix distribution (first 4 chars)
-    prefix_counts = {}
-    for hash_val in valid_hashes:
-        prefix = hash_val[:4]
-        prefix_counts[prefix] = prefix_counts.get(prefix, 0) + 1
+    prefix_counts = Counter(hash_val[:4] for hash_val in valid_hashes)
     
     collision_rate = (len(valid_hashes) - len(unique_hashes)) / len(valid_hashes) if valid_hashes else 0
     
@@ -227,6 +274,26 @@ def calculate_hash_quality_metrics(hashes: List[str]) -> Dict[str, Any]:
         "prefix_distribution": len(prefix_counts)
     }
 
+def get_normalizer_stats() -> Dict[str, Any]:
+    """
+    Get LRU cache statistics for the hash normalizers
+    
+    Returns:
+        Hit/miss counts and hit rate per normalizer
+    """
+    stats = {}
+    for name, normalizer in (("text", normalize_text_for_hash), ("url", normalize_url_for_hash)):
+        info = normalizer.cache_info()
+        lookups = info.hits + info.misses
+        stats[name] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "max_size": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0
+        }
+    return stats
+
 # Testing and validation functions
 if __name__ == "__main__":
     # Test hash generation
@@ -254,3 +321,4 @@ if __name__ == "__main__":
     all_hashes = list(batch_hashes.values())
     metrics = calculate_hash_quality_metrics(all_hashes)
     print(f"\nHash quality metrics: {metrics}")
+    print(f"\nNormalizer cache stats: {get_normalizer_stats()}")
@@ -0,0 +1,23 @@
+"""
+Small shared helpers for the app and its scripts
+"""
+
+import asyncio
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for asyncio event loops when it is available
+
+    uvloop ships with uvicorn[standard]; without it the default loop is kept.
+
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -4,18 +4,50 @@ Handles connection pooling, failover, and environment detection
 """
 
 import os
+import re
+import struct
+import threading
+import time
 import redis
 from redis.connection import ConnectionPool
 # Add cast for type hinting and datetime for a bug fix
-from typing import Optional, Any, Dict, List, Union, cast , Set
+from typing import Optional, Any, Dict, List, Tuple, Union, cast , Set
 import logging
-import json
+import orjson
+import zstandard as zstd
 from datetime import timedelta, datetime # Added datetime import
 from collections import defaultdict
+from functools import lru_cache
+from cachetools import TTLCache
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Credentials segment of a redis:// URL, masked before logging
+_URL_MASK_RE = re.compile(r'://([^:]+):([^@]+)@')
+
+# Leading marker byte for zstd-compressed JSON values (plain JSON never starts with it)
+_ZSTD_MARKER = b'\x01'
+
+@lru_cache(maxsize=32)
+def _hour_bucket(year: int, month: int, day: int, hour: int) -> str:
+    """Format an hourly bucket suffix (YYYYMMDD_HH), memoized per hour"""
+    return f"{year:04d}{month:02d}{day:02d}_{hour:02d}"
+
+def _hour_bucket_for(dt: datetime) -> str:
+    """Hourly bucket suffix for a datetime"""
+    return _hour_bucket(dt.year, dt.month, dt.day, dt.hour)
+
+# Key families counted for cache analytics
+CACHE_KEY_PATTERNS = {
+    'articles': 'article:*',
+    'topics': 'topic:*',
+    'recency': 'recency:*',
+    'source_perf': 'source_perf:*',
+    'digests': 'digest:*',
+    'rss_stats': 'rss:stats:*'
+}
+
 class RedisClient:
     """Enhanced Redis client with cloud migration support"""
     
@@ -35,12 +67,47 @@ class RedisClient:
         self.socket_connect_timeout = socket_connect_timeout
         self.retry_on_timeout = retry_on_timeout
         
+        # Short-lived INFO snapshot shared by analytics and health checks
+        self._info_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        
+        # In-process L1 for hot article payloads (keyed by Redis key)
+        self._l1: TTLCache = TTLCache(maxsize=4096, ttl=60)
+        self._l1_lock = threading.Lock()
+        self._l1_hits = 0
+        self._l1_misses = 0
+        
+        # zstd codec for large JSON payloads (instances are not safe for concurrent use)
+        self._zc = zstd.ZstdCompressor(level=1)
+        self._zd = zstd.ZstdDecompressor()
+        self._zstd_lock = threading.Lock()
+        
         # Create connection pool
         self.pool = self._create_connection_pool()
         self.client = redis.Redis(connection_pool=self.pool)
         
+        # Binary-safe client for packed payloads (no response decoding)
+        # Article/digest reads go through this pool, so it also carries the optional RESP3 cache
+        self.raw_pool = self._create_connection_pool(
+            decode_responses=False,
+            client_cache=settings.ENABLE_CLIENT_CACHE
+        )
+        self.raw_client = redis.Redis(connection_pool=self.raw_pool)
+        
         # Test connection
         self._test_connection()
+        
+        # Optional background key counting so analytics never scan inline
+        self._key_counts_snapshot: Optional[Dict[str, int]] = None
+        self._shutdown_event = threading.Event()
+        self._analytics_thread: Optional[threading.Thread] = None
+        if settings.REDIS_ANALYTICS_REFRESH_SECONDS > 0:
+            self._analytics_thread = threading.Thread(
+                target=self._refresh_analytics_loop,
+                args=(settings.REDIS_ANALYTICS_REFRESH_SECONDS,),
+                name="redis-analytics-refresh",
+                daemon=True
+            )
+            self._analytics_thread.start()
     
     def _get_redis_url(self) -> str:
         """Get Redis URL with environment detection"""
@@ -61,8 +128,11 @@ class RedisClient:
         logger.info("Using local Redis connection")
         return settings.REDIS_URL
     
-    def _create_connection_pool(self) -> ConnectionPool:
+    def _create_connection_pool(self, decode_responses: bool = True, client_cache: bool = False) -> ConnectionPool:
         """Create Redis connection pool with cloud-ready settings"""
+        extra_kwargs: Dict[str, Any] = {}
+        if client_cache:
+            extra_kwargs = self._client_cache_kwargs()
         return ConnectionPool.from_url(
             self.redis_url,
             max_connections=self.max_connections,
@@ -70,9 +140,19 @@ class RedisClient:
             socket_connect_timeout=self.socket_connect_timeout,
             retry_on_timeout=self.retry_on_timeout,
             health_check_interval=30,
-            decode_responses=True
+            decode_responses=decode_responses,
+            **extra_kwargs
         )
     
+    def _client_cache_kwargs(self) -> Dict[str, Any]:
+        """RESP3 client-side cache settings, if the installed redis-py supports them"""
+        try:
+            from redis.cache import CacheConfig  # redis-py 5.1+
+        except ImportError:
+            logger.warning("ENABLE_CLIENT_CACHE is set but redis-py lacks RESP3 client caching; using in-process L1 only")
+            return {}
+        return {'protocol': 3, 'cache_config': CacheConfig(max_size=10_000)}
+    
     def _test_connection(self):
         """Test Redis connection and log status"""
         try:
@@ -84,8 +164,7 @@ class RedisClient:
     
     def _mask_url(self, url: str) -> str:
         """Mask credentials in Redis URL for logging"""
-        import re
-        return re.sub(r'://([^:]+):([^@]+)@', '://***:***@', url)
+        return _URL_MASK_RE.sub('://***:***@', url)
     
     # Core Redis operations with error handling and type casting for Pylance
     
@@ -115,6 +194,9 @@ class RedisClient:
     
     def delete(self, *keys: str) -> int:
         """Delete one or more keys"""
+        with self._l1_lock:
+            for key in keys:
+                self._l1.pop(key, None)
         try:
             return cast(int, self.client.delete(*keys))
         except Exception as e:
@@ -148,26 +230,64 @@ class RedisClient:
     
     # JSON operations for complex data
     
-    def set_json(self, key: str, data: Dict[str, Any], ex: Optional[int] = None) -> bool:
-        """Set JSON data with optional expiration"""
+    def _encode_json(self, data: Dict[str, Any], compress: bool = False) -> bytes:
+        """Serialize to JSON bytes, optionally zstd-compressed behind a marker byte"""
+        json_bytes = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+        if not compress:
+            return json_bytes
+        with self._zstd_lock:
+            return _ZSTD_MARKER + self._zc.compress(json_bytes)
+    
+    def _decode_json(self, raw: Union[str, bytes]) -> Dict[str, Any]:
+        """Deserialize plain or zstd-compressed JSON"""
+        if isinstance(raw, bytes) and raw[:1] == _ZSTD_MARKER:
+            with self._zstd_lock:
+                raw = self._zd.decompress(raw[1:])
+        return cast(Dict[str, Any], orjson.loads(raw))
+    
+    def set_json(self, key: str, data: Dict[str, Any], ex: Optional[int] = None, pipe=None,
+                 compress: bool = False) -> Optional[bool]:
+        """Set JSON data with optional expiration (queued on pipe if given; caller executes)"""
         try:
-            json_str = json.dumps(data, default=str)
-            return self.set(key, json_str, ex=ex)
+            json_bytes = self._encode_json(data, compress)
+            if pipe is not None:
+                pipe.set(key, json_bytes, ex=ex)
+                return None
+            return cast(bool, self.client.set(key, json_bytes, ex=ex))
         except Exception as e:
             logger.error(f"Redis SET_JSON failed for key {key}: {e}")
             return False
     
-    def get_json(self, key: str) -> Optional[Dict[str, Any]]:
-        """Get JSON data"""
+    def get_json(self, key: str, compressed: bool = False) -> Optional[Dict[str, Any]]:
+        """Get JSON data (compressed=True reads binary-safe for zstd payloads)"""
         try:
-            json_str = self.get(key)
-            if json_str:
-                return cast(Dict[str, Any], json.loads(json_str))
+            raw = self.raw_client.get(key) if compressed else self.get(key)
+            if raw:
+                return self._decode_json(raw)
             return None
         except Exception as e:
             logger.error(f"Redis GET_JSON failed for key {key}: {e}")
             return None
     
+    def mget_json(self, keys: List[str], compressed: bool = False) -> List[Optional[Dict[str, Any]]]:
+        """Get JSON data for many keys in one round-trip (None for missing keys)"""
+        if not keys:
+            return []
+        try:
+            client = self.raw_client if compressed else self.client
+            values = cast(List[Optional[Union[str, bytes]]], client.mget(keys))
+        except Exception as e:
+            logger.error(f"Redis MGET_JSON failed for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+        results: List[Optional[Dict[str, Any]]] = []
+        for key, value in zip(keys, values):
+            try:
+                results.append(self._decode_json(value) if value else None)
+            except (orjson.JSONDecodeError, zstd.ZstdError) as e:
+                logger.error(f"Redis MGET_JSON decode failed for key {key}: {e}")
+                results.append(None)
+        return results
+    
     # List operations
     
     def lpush(self, key: str, *values: Any) -> int:
@@ -248,58 +368,133 @@ class RedisClient:
     
     # Cache-specific operations
     
-    def cache_article_by_hash(self, content_hash: str, article_data: Dict[str, Any], ttl: int = 3600) -> bool:
+    def cache_article_by_hash(self, content_hash: str, article_data: Dict[str, Any], ttl: int = 3600, pipe=None) -> Optional[bool]:
         """Cache article data by content hash"""
         key = f"article:{content_hash}"
-        return self.set_json(key, article_data, ex=ttl)
+        stored = self.set_json(key, article_data, ex=ttl, pipe=pipe, compress=True)
+        if stored:
+            # Write-through only once Redis has the value (pipelined writes aren't confirmed yet)
+            with self._l1_lock:
+                self._l1[key] = dict(article_data)
+        return stored
     
     def get_cached_article(self, content_hash: str) -> Optional[Dict[str, Any]]:
-        """Get cached article by content hash"""
+        """Get cached article by content hash (in-process L1, then Redis)"""
         key = f"article:{content_hash}"
-        return self.get_json(key)
-    
-    def cache_articles_by_topic(self, topic: str, article_ids: List[int], ttl: int = 1800):
-        """Cache article IDs by topic"""
-        key = f"topic:{topic}:articles"
+        with self._l1_lock:
+            article = self._l1.get(key)
+            if article is not None:
+                self._l1_hits += 1
+                return dict(article)  # Callers may mutate their copy, not the cached one
+            self._l1_misses += 1
+        article = self.get_json(key, compressed=True)
+        if article is not None:
+            with self._l1_lock:
+                self._l1[key] = dict(article)
+        return article
+    
+    @staticmethod
+    def _pack_article_ids(article_ids: List[int]) -> bytes:
+        """Pack article IDs as little-endian int32s"""
+        return struct.pack(f'<{len(article_ids)}i', *article_ids)
+    
+    @staticmethod
+    def _unpack_article_ids(raw: bytes) -> List[int]:
+        """Unpack article IDs written by _pack_article_ids"""
+        return list(struct.unpack(f'<{len(raw) // 4}i', raw[:len(raw) - len(raw) % 4]))
+    
+    @staticmethod
+    def _queue_id_set_replace(pipe, key: str, article_ids: List[int], ttl: int):
+        """Queue an atomic SADD-into-temp + RENAME swap for an article ID set"""
         article_ids_str = [str(aid) for aid in article_ids]
-        self.delete(key)  # Clear existing
-        if article_ids_str:
-            self.lpush(key, *article_ids_str)
-            self.expire(key, ttl)
+        if not article_ids_str:
+            pipe.delete(key)
+            return
+        tmp_key = f"{key}:tmp"
+        pipe.delete(tmp_key)
+        pipe.sadd(tmp_key, *article_ids_str)
+        pipe.expire(tmp_key, ttl)
+        pipe.rename(tmp_key, key)
+    
+    def cache_articles_by_topic(self, topic: str, article_ids: List[int], ttl: int = 1800) -> bool:
+        """Cache article IDs by topic (stored as a Redis set)"""
+        key = f"topic:{topic}:articles"
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            self._queue_id_set_replace(pipe, key, article_ids, ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error caching topic articles for {topic}: {e}")
+            return False
+    
+    def cache_articles_by_topics_batch(self, topic_articles: Dict[str, List[int]], ttl: int = 1800) -> bool:
+        """Cache article IDs for many topics in a single round-trip"""
+        if not topic_articles:
+            return True
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            for topic, article_ids in topic_articles.items():
+                self._queue_id_set_replace(pipe, f"topic:{topic}:articles", article_ids, ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error batch caching topic articles: {e}")
+            return False
     
     def get_articles_by_topic(self, topic: str) -> List[int]:
-        """Get cached article IDs by topic"""
+        """Get cached article IDs by topic, newest (highest ID) first"""
         key = f"topic:{topic}:articles"
-        article_ids_str = self.lrange(key)
-        return [int(aid) for aid in article_ids_str if aid.isdigit()]
+        return sorted((int(aid) for aid in self.smembers(key)), reverse=True)
+    
+    def _set_json_hour_bucket(self, key: str, data: Dict[str, Any], bucket_start: datetime, ttl: int,
+                              compress: bool = False) -> bool:
+        """Set JSON for an hourly bucket key, expiring ttl seconds after the bucket closes"""
+        try:
+            expire_at = bucket_start + timedelta(hours=1, seconds=ttl)
+            pipe = self.client.pipeline(transaction=False)
+            # set_json reports encoding failures with False; don't queue a bare EXPIREAT then
+            if self.set_json(key, data, pipe=pipe, compress=compress) is False:
+                return False
+            pipe.expireat(key, int(expire_at.timestamp()))
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis hour-bucket SET failed for key {key}: {e}")
+            return False
     
     def cache_rss_collection_stats(self, stats: Dict[str, Any], ttl: int = 3600) -> bool:
         """Cache RSS collection statistics"""
         # Fixed: Used datetime.now() which requires the datetime import
-        key = f"rss:stats:{datetime.now().strftime('%Y%m%d_%H')}"
-        return self.set_json(key, stats, ex=ttl)
+        bucket_start = datetime.now().replace(minute=0, second=0, microsecond=0)
+        key = f"rss:stats:{_hour_bucket_for(bucket_start)}"
+        return self._set_json_hour_bucket(key, stats, bucket_start, ttl)
     
     def get_recent_rss_stats(self) -> List[Dict[str, Any]]:
         """Get recent RSS collection statistics"""
-        pattern = "rss:stats:*"
-        keys = cast(List[str], self.client.keys(pattern))
-        stats: List[Dict[str, Any]] = []
-        for key in sorted(keys)[-24:]:  # Last 24 hours
-            stat = self.get_json(key)
-            if stat:
-                stats.append(stat)
-        return stats
-    
-    def cache_articles_by_recency(self, time_bucket: str, article_ids: List[int], ttl: int = 3600) -> bool:
-        """Cache article IDs by time bucket (1h, 6h, 24h)"""
+        # Build the exact hourly bucket keys (oldest first) instead of scanning the keyspace
+        now = datetime.now()
+        keys = [
+            f"rss:stats:{_hour_bucket_for(now - timedelta(hours=h))}"
+            for h in range(23, -1, -1)  # Last 24 hours
+        ]
+        return [stat for stat in self.mget_json(keys) if stat]
+    
+    def cache_articles_by_recency(self, time_bucket: str, article_ids: List[int], ttl: int = 3600, pipe=None) -> Optional[bool]:
+        """Cache article IDs by time bucket (1h, 6h, 24h); queues on pipe (a raw_client pipeline) if given"""
         key = f"recency:{time_bucket}:articles"
         try:
-            article_ids_str = [str(aid) for aid in article_ids]
-            self.delete(key)  # Clear existing
-            if article_ids_str:
-                self.lpush(key, *article_ids_str)
-                self.expire(key, ttl)
-            return True
+            if pipe is not None:
+                if article_ids:
+                    pipe.set(key, self._pack_article_ids(article_ids), ex=ttl)
+                else:
+                    pipe.delete(key)
+                return None
+            if not article_ids:
+                self.delete(key)
+                return True
+            # One SET of a packed int32 blob instead of DELETE + LPUSH + EXPIRE
+            return bool(self.raw_client.set(key, self._pack_article_ids(article_ids), ex=ttl))
         except Exception as e:
             logger.error(f"Error caching recency articles: {e}")
             return False
@@ -308,17 +503,17 @@ class RedisClient:
         """Get cached articles by time bucket"""
         key = f"recency:{time_bucket}:articles"
         try:
-            article_ids_str = self.lrange(key)
-            return [int(aid) for aid in article_ids_str if aid.isdigit()]
+            raw = cast(Optional[bytes], self.raw_client.get(key))
+            return self._unpack_article_ids(raw) if raw else []
         except Exception as e:
             logger.error(f"Error getting recency articles: {e}")
             return []
     
-    def cache_source_performance(self, source_id: int, metrics: Dict[str, Any], ttl: int = 1800) -> bool:
+    def cache_source_performance(self, source_id: int, metrics: Dict[str, Any], ttl: int = 1800, pipe=None) -> Optional[bool]:
         """Cache RSS source performance metrics"""
         key = f"source_perf:{source_id}"
         try:
-            return self.set_json(key, metrics, ex=ttl)
+            return self.set_json(key, metrics, ex=ttl, pipe=pipe)
         except Exception as e:
             logger.error(f"Error caching source performance: {e}")
             return False
@@ -330,15 +525,18 @@ class RedisClient:
     
     def cache_news_digest(self, digest_type: str, content: Dict[str, Any], ttl: int = 7200) -> bool:
         """Cache pre-computed news digests"""
-        key = f"digest:{digest_type}:{datetime.now().strftime('%Y%m%d_%H')}"
-        return self.set_json(key, content, ex=ttl)
+        bucket_start = datetime.now().replace(minute=0, second=0, microsecond=0)
+        key = f"digest:{digest_type}:{_hour_bucket_for(bucket_start)}"
+        return self._set_json_hour_bucket(key, content, bucket_start, ttl, compress=True)
     
     def get_news_digest(self, digest_type: str) -> Optional[Dict[str, Any]]:
         """Get cached news digest (try current hour, then previous hour)"""
-        for hour_offset in [0, 1]:
-            target_time = datetime.now() - timedelta(hours=hour_offset)
-            key = f"digest:{digest_type}:{target_time.strftime('%Y%m%d_%H')}"
-            digest = self.get_json(key)
+        now = datetime.now()
+        keys = [
+            f"digest:{digest_type}:{_hour_bucket_for(now - timedelta(hours=hour_offset))}"
+            for hour_offset in [0, 1]
+        ]
+        for digest in self.mget_json(keys, compressed=True):
             if digest:
                 return digest
         return None
@@ -348,28 +546,39 @@ class RedisClient:
         key = f"topic:{topic}:articles"
         return bool(self.delete(key))
     
+    def _count_keys_by_pattern(self, scan_count: int = 500) -> Dict[str, int]:
+        """Count cache keys per family with non-blocking SCAN (unlike KEYS)"""
+        return {
+            cache_type: sum(1 for _ in self.client.scan_iter(match=pattern, count=scan_count))
+            for cache_type, pattern in CACHE_KEY_PATTERNS.items()
+        }
+    
+    def _refresh_analytics_loop(self, interval: int):
+        """Background loop refreshing the key count snapshot until close()"""
+        while not self._shutdown_event.is_set():
+            try:
+                self._key_counts_snapshot = self._count_keys_by_pattern(scan_count=1000)
+            except Exception as e:
+                logger.error(f"Error refreshing cache key counts: {e}")
+            self._shutdown_event.wait(interval)
+    
+    def get_l1_stats(self) -> Dict[str, int]:
+        """Get this process's in-memory article cache counters"""
+        return {
+            'size': len(self._l1),
+            'hits': self._l1_hits,
+            'misses': self._l1_misses
+        }
+    
     def get_cache_analytics(self) -> Dict[str, Any]:
         """Get cache analytics and metrics"""
         try:
-            info = cast(Dict[str, Any], self.client.info())
-            
-            # Get key counts by pattern
-            patterns = {
-                'articles': 'article:*',
-                'topics': 'topic:*',
-                'recency': 'recency:*',
-                'source_perf': 'source_perf:*',
-                'digests': 'digest:*',
-                'rss_stats': 'rss:stats:*'
-            }
+            info = self._info_cached()
             
-            key_counts = {}
-            total_keys = 0
-            
-            for cache_type, pattern in patterns.items():
-                keys = cast(List[str], self.client.keys(pattern))
-                key_counts[cache_type] = len(keys)
-                total_keys += len(keys)
+            # Prefer the background snapshot; scan inline when it is disabled or not ready yet
+            snapshot = self._key_counts_snapshot
+            key_counts = dict(snapshot) if snapshot is not None else self._count_keys_by_pattern()
+            total_keys = sum(key_counts.values())
             
             return {
                 'total_keys': total_keys,
@@ -378,16 +587,26 @@ class RedisClient:
                 'connected_clients': info.get('connected_clients', 0),
                 'total_commands_processed': info.get('total_commands_processed', 0),
                 'cache_hit_rate': self._calculate_hit_rate(),
+                'l1_article_cache': self.get_l1_stats(),
                 'timestamp': datetime.now().isoformat()
             }
         except Exception as e:
             logger.error(f"Error getting cache analytics: {e}")
             return {'error': str(e)}
     
+    def _info_cached(self, ttl: float = 1.0) -> Dict[str, Any]:
+        """Return Redis INFO, reusing the last result for up to ttl seconds"""
+        now = time.monotonic()
+        if self._info_cache and now - self._info_cache[0] < ttl:
+            return self._info_cache[1]
+        info = cast(Dict[str, Any], self.client.info())
+        self._info_cache = (now, info)
+        return info
+    
     def _calculate_hit_rate(self) -> float:
         """Calculate cache hit rate from Redis stats"""
         try:
-            info = cast(Dict[str, Any], self.client.info())
+            info = self._info_cached()
             hits = info.get('keyspace_hits', 0)
             misses = info.get('keyspace_misses', 0)
             total = hits + misses
@@ -401,11 +620,11 @@ class RedisClient:
     def health_check(self) -> Dict[str, Any]:
         """Perform Redis health check"""
         try:
-            start_time = datetime.now()
+            start_ns = time.monotonic_ns()
             self.client.ping()
-            response_time = (datetime.now() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic_ns() - start_ns) / 1e6
             
-            info = cast(Dict[str, Any], self.client.info())
+            info = self._info_cached()
             
             return {
                 'status': 'healthy',
@@ -422,8 +641,10 @@ class RedisClient:
     
     def close(self):
         """Close Redis connection"""
+        self._shutdown_event.set()
         try:
             self.client.close()
+            self.raw_client.close()
             logger.info("Redis connection closed")
         except Exception as e:
             logger.error(f"Error closing Redis connection: {e}")
@@ -5,13 +5,39 @@ Removes HTML, normalizes text, handles encoding issues
 
 import re
 import html
-from typing import Optional, Dict, Any
+import threading
+from collections import deque
+from typing import Optional, Dict, Any, Deque
 from bs4 import BeautifulSoup, NavigableString
+from cachetools import LRUCache
+import xxhash
 import unicodedata
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based selectolax parser; BeautifulSoup remains the fallback
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+    logger.info("selectolax not installed, falling back to BeautifulSoup for HTML cleaning")
+
+# Precompiled whitespace/markup patterns used on every cleaned field
+_RE_MULTISPACE = re.compile(r' {2,}')
+_RE_WORD = re.compile(r'\S+')
+_WS_TBL = str.maketrans({'\t': ' ', '\r': '\n'})
+
+# Literals at least one of which every junk pattern alternative requires (lowercase).
+# The bare 'ad' marker is too common a substring to prescreen, so it gets its own search.
+_JUNK_TRIGGERS = (
+    'facebook', 'twitter', 'linkedin', 'instagram', 'whatsapp',
+    'advertisement', 'sponsored', 'subscribe', 'sign',
+    '©', 'terms', 'privacy', 'filed', 'tags', 'category',
+    '...', 'continue', 'story', 'getty', 'reuters', 'source',
+)
+_RE_AD_MARKER = re.compile(r'\bad\b', re.IGNORECASE)
+
 class TextCleaner:
     """Comprehensive text cleaning for RSS content"""
     
@@ -37,43 +63,41 @@ class TextCleaner:
         'hr': '\n---\n'
     }
     
-    # Common RSS feed junk patterns
+    # Common RSS feed junk patterns (grouped by category with shared stems factored out)
     JUNK_PATTERNS = [
         # Social media sharing text
-        r'share\s+on\s+(facebook|twitter|linkedin|whatsapp)',
-        r'follow\s+us\s+on\s+(facebook|twitter|instagram)',
-        r'like\s+us\s+on\s+facebook',
+        r'(?:share|follow\s+us|like\s+us)\s+on\s+(?:facebook|twitter|linkedin|instagram|whatsapp)',
         
         # Advertisement indicators
-        r'advertisement\s*:?\s*',
-        r'\[?\s*ad\s*\]?',
-        r'sponsored\s+content',
+        r'advertisement\s*:?\s*|sponsored\s+content|\[?\s*\bad\b\s*\]?',
         
         # Newsletter/subscription prompts
-        r'subscribe\s+to\s+our\s+newsletter',
-        r'sign\s+up\s+for\s+updates',
+        r'(?:subscribe\s+to\s+our\s+newsletter|sign\s+up\s+for\s+updates)',
         
-        # Copyright and legal text
-        r'©\s*\d{4}.*?all\s+rights\s+reserved',
-        r'terms\s+of\s+use',
-        r'privacy\s+policy',
+        # Copyright and legal text (copyright gap bounded to cap backtracking)
+        r'©\s*\d{4}.{0,120}?all\s+rights\s+reserved|terms\s+of\s+use|privacy\s+policy',
         
         # Common RSS metadata
-        r'filed\s+under\s*:',
-        r'tags\s*:',
-        r'category\s*:',
+        r'(?:filed\s+under|tags|category)\s*:',
         
         # Read more links
-        r'read\s+more\s*\.{3}',
-        r'continue\s+reading',
-        r'full\s+story\s+here',
+        r'read\s+more\s*\.{3}|continue\s+reading|full\s+story\s+here',
         
         # Image captions patterns
-        r'image\s*:\s*getty\s+images',
-        r'photo\s*:\s*reuters',
-        r'source\s*:\s*[a-zA-Z\s]+',
+        r'image\s*:\s*getty\s+images|photo\s*:\s*reuters',
     ]
     
+    # Source credits run greedily across lines, so they get their own pass after
+    # the fused patterns rather than swallowing a caption that follows them
+    SOURCE_CREDIT_PATTERN = r'source\s*:\s*[a-zA-Z\s]+'
+    
+    # All junk patterns fused into one alternation: a single scan instead of one per pattern
+    _JUNK_RE = re.compile(
+        '|'.join(f'(?:{pattern})' for pattern in JUNK_PATTERNS),
+        re.IGNORECASE | re.MULTILINE
+    )
+    _SOURCE_CREDIT_RE = re.compile(SOURCE_CREDIT_PATTERN, re.IGNORECASE | re.MULTILINE)
+    
     @classmethod
     def clean_html_content(cls, html_content: Optional[str]) -> Optional[str]:
         """
@@ -88,20 +112,32 @@ class TextCleaner:
         if not html_content or not isinstance(html_content, str):
             return None
         
+        # Re-polled feeds redeliver identical bodies; serve those from the memo
+        return _clean_html_cached(html_content)
+    
+    @classmethod
+    def _clean_html_impl(cls, html_content: str) -> Optional[str]:
+        """Uncached HTML cleaning (see clean_html_content)"""
         try:
-            # Decode HTML entities first
-            decoded = html.unescape(html_content)
-            
-            # Parse with BeautifulSoup
-            soup = BeautifulSoup(decoded, 'html.parser')
-            
-            # Remove unwanted tags completely
-            for tag_name in cls.REMOVE_TAGS:
-                for tag in soup.find_all(tag_name):
-                    tag.decompose()
-            
-            # Convert HTML to text with formatting preservation
-            text = cls._extract_text_with_formatting(soup)
+            if HTMLParser is not None:
+                # selectolax decodes entities in text nodes itself; only pre-decode when the
+                # feed entity-escaped its markup, so those tags still get parsed and stripped
+                markup = html.unescape(html_content) if '&lt;' in html_content else html_content
+                text = cls._extract_text_selectolax(markup)
+            else:
+                # Decode HTML entities first
+                decoded = html.unescape(html_content)
+                
+                # Parse with BeautifulSoup
+                soup = BeautifulSoup(decoded, 'html.parser')
+                
+                # Remove unwanted tags completely
+                for tag_name in cls.REMOVE_TAGS:
+                    for tag in soup.find_all(tag_name):
+                        tag.decompose()
+                
+                # Convert HTML to text with formatting preservation
+                text = cls._extract_text_with_formatting(soup)
             
             # Clean up the text
             cleaned = cls._post_process_text(text)
@@ -113,33 +149,72 @@ class TextCleaner:
             # Fallback to simple HTML tag removal
             return cls._simple_html_strip(html_content)
     
+    @classmethod
+    def _extract_text_selectolax(cls, decoded: str) -> str:
+        """Parse with selectolax and extract text with formatting in one iterative walk"""
+        tree = HTMLParser(decoded)
+        
+        # Remove unwanted tags completely (including content)
+        tree.strip_tags(cls.REMOVE_TAGS)
+        
+        text_parts = []
+        stack = [(tree.root, False)] if tree.root is not None else []
+        
+        while stack:
+            node, closing = stack.pop()
+            if closing:
+                text_parts.append('"')  # Closing formatting for blockquote
+                continue
+            
+            tag_name = node.tag
+            if tag_name == '-text':
+                text_parts.append(node.text(deep=False))
+                continue
+            
+            # Add opening formatting for certain tags
+            if tag_name in cls.PRESERVE_TAGS:
+                text_parts.append(cls.PRESERVE_TAGS[tag_name])
+            if tag_name == 'blockquote':
+                stack.append((node, True))
+            
+            # Push children so they pop in document order
+            children = []
+            child = node.child
+            while child is not None:
+                children.append(child)
+                child = child.next
+            stack.extend((c, False) for c in reversed(children))
+        
+        return ''.join(text_parts)
+    
     @classmethod
     def _extract_text_with_formatting(cls, soup: BeautifulSoup) -> str:
-        """Extract text while preserving some formatting"""
-        def extract_text_recursive(element):
+        """Extract text while preserving some formatting (one iterative walk, like the selectolax path)"""
+        text_parts = []
+        stack = [(soup, False)]
+        
+        while stack:
+            element, closing = stack.pop()
+            if closing:
+                text_parts.append('"')  # Closing formatting for blockquote
+                continue
+            
             if isinstance(element, NavigableString):
-                return str(element)
+                text_parts.append(str(element))
+                continue
             
             tag_name = element.name.lower() if element.name else ''
-            text_parts = []
             
             # Add opening formatting for certain tags
             if tag_name in cls.PRESERVE_TAGS:
                 text_parts.append(cls.PRESERVE_TAGS[tag_name])
-            
-            # Process children
-            for child in element.children:
-                child_text = extract_text_recursive(child)
-                if child_text:
-                    text_parts.append(child_text)
-            
-            # Add closing formatting for certain tags
             if tag_name == 'blockquote':
-                text_parts.append('"')
+                stack.append((element, True))
             
-            return ''.join(text_parts)
+            # Push children so they pop in document order
+            stack.extend((child, False) for child in reversed(element.contents))
         
-        return extract_text_recursive(soup)
+        return ''.join(text_parts)
     
     @classmethod
     def _post_process_text(cls, text: str) -> str:
@@ -147,52 +222,75 @@ class TextCleaner:
         if not text:
             return ""
         
-        # Normalize unicode characters
-        text = unicodedata.normalize('NFKC', text)
+        # Normalize unicode characters (quick-check skips the copy for already-normalized text)
+        if not unicodedata.is_normalized('NFKC', text):
+            text = unicodedata.normalize('NFKC', text)
         
-        # Remove RSS junk patterns
-        for pattern in cls.JUNK_PATTERNS:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.MULTILINE)
+        # Remove RSS junk patterns, skipping the full scan when no trigger is present
+        lowered = text.lower()
+        if any(trigger in lowered for trigger in _JUNK_TRIGGERS) or _RE_AD_MARKER.search(text):
+            text = cls._JUNK_RE.sub('', text)
+            text = cls._SOURCE_CREDIT_RE.sub('', text)
         
         # Clean up whitespace
         text = cls._normalize_whitespace(text)
         
-        # Remove empty lines and excessive spacing
-        lines = [line.strip() for line in text.split('\n')]
+        # Remove empty lines and immediate duplicates in a single scan
         cleaned_lines = []
+        recent_lines: Deque[str] = deque(maxlen=3)
         
-        for line in lines:
-            if line and line not in cleaned_lines[-3:]:  # Avoid immediate duplicates
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            if line and line not in recent_lines:  # Avoid immediate duplicates
                 cleaned_lines.append(line)
+                recent_lines.append(line)
         
-        # Join lines with proper spacing
-        result = '\n'.join(cleaned_lines)
-        
-        # Final cleanup
-        result = re.sub(r'\n{3,}', '\n\n', result)  # Max 2 consecutive newlines
-        result = result.strip()
-        
-        return result
+        # Blank lines are already dropped, so no newline-run cleanup is needed
+        return '\n'.join(cleaned_lines)
     
     @classmethod
     def _normalize_whitespace(cls, text: str) -> str:
         """Normalize whitespace in text"""
-        # Replace multiple spaces with single space
-        text = re.sub(r' {2,}', ' ', text)
+        # Normalize line endings (CRLF first so it becomes a single newline)
+        if '\r\n' in text:
+            text = text.replace('\r\n', '\n')
         
-        # Replace tabs with spaces
-        text = text.replace('\t', ' ')
+        # Replace tabs with spaces and lone CRs with newlines in one pass
+        text = text.translate(_WS_TBL)
         
-        # Normalize line endings
-        text = re.sub(r'\r\n?', '\n', text)
+        # Replace multiple spaces with single space
+        if '  ' in text:
+            text = _RE_MULTISPACE.sub(' ', text)
         
         return text
     
+    @staticmethod
+    def _strip_tags_scan(text: str) -> str:
+        """Remove <...> tags using str.find (same matches as the <[^>]+> regex)"""
+        parts = []
+        pos = 0
+        while True:
+            start = text.find('<', pos)
+            if start < 0:
+                break
+            end = text.find('>', start + 1)
+            if end < 0:
+                break  # Unclosed '<' is kept as text
+            if end == start + 1:
+                # '<>' is not a tag; keep the '<' and rescan from the '>'
+                parts.append(text[pos:start + 1])
+                pos = start + 1
+                continue
+            parts.append(text[pos:start])
+            pos = end + 1
+        parts.append(text[pos:])
+        return ''.join(parts)
+    
     @classmethod
     def _simple_html_strip(cls, html_content: str) -> str:
         """Simple HTML tag removal fallback"""
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', html_content)
+        text = cls._strip_tags_scan(html_content)
         
         # Decode HTML entities
         text = html.unescape(text)
@@ -224,49 +322,56 @@ class TextCleaner:
         if len(first_paragraph) <= max_length:
             return first_paragraph
         
-        # Try to cut at sentence boundary
+        # Try to cut at sentence boundary (track lengths, build the string once)
         sentences = first_paragraph.split('. ')
-        summary = ""
+        total_length = 0
+        cut = 0
         
         for sentence in sentences:
-            potential_summary = summary + sentence + '. '
-            if len(potential_summary) > max_length:
+            total_length += len(sentence) + 2  # sentence + '. '
+            if total_length > max_length:
                 break
-            summary = potential_summary
+            cut += 1
         
         # If we have something, return it
-        if summary.strip():
-            return summary.strip()
+        summary = ''.join(sentence + '. ' for sentence in sentences[:cut]).strip()
+        if summary:
+            return summary
         
         # Otherwise, cut at word boundary
         words = first_paragraph.split()
-        summary = ""
+        total_length = 0
+        cut = 0
         
         for word in words:
-            potential_summary = summary + word + ' '
-            if len(potential_summary) > max_length - 3:
+            total_length += len(word) + 1  # word + ' '
+            if total_length > max_length - 3:
                 break
-            summary = potential_summary
+            cut += 1
         
-        return (summary.strip() + '...') if summary.strip() else first_paragraph[:max_length-3] + '...'
+        summary = ' '.join(words[:cut])
+        return (summary + '...') if summary else first_paragraph[:max_length-3] + '...'
     
     @classmethod
-    def calculate_reading_time(cls, content: str, words_per_minute: int = 200) -> int:
+    def calculate_reading_time(cls, content: Optional[str] = None, words_per_minute: int = 200,
+                               word_count: Optional[int] = None) -> int:
         """
         Calculate estimated reading time in minutes
         
         Args:
             content: Text content
             words_per_minute: Average reading speed
+            word_count: Precomputed word count (skips counting content)
             
         Returns:
             Reading time in minutes (minimum 1)
         """
-        if not content:
-            return 1
-        
-        # Count words
-        word_count = len(content.split())
+        if word_count is None:
+            if not content or not content.strip():
+                return 1
+            
+            # Count words without building a word list
+            word_count = sum(1 for _ in _RE_WORD.finditer(content))
         
         # Calculate reading time
         reading_time = max(1, round(word_count / words_per_minute))
@@ -291,17 +396,22 @@ class TextCleaner:
             title = cls.clean_html_content(cleaned_item['title'])
             cleaned_item['title'] = title.replace('\n', ' ').strip() if title else None
         
-        # Clean content/description
+        # Clean content/description (identical raw fields are only cleaned once)
         content_fields = ['content', 'description', 'summary']
+        cleaned_by_raw: Dict[str, Optional[str]] = {}
         for field in content_fields:
             if field in cleaned_item and cleaned_item[field]:
-                cleaned_content = cls.clean_html_content(cleaned_item[field])
+                raw_content = cleaned_item[field]
+                if raw_content not in cleaned_by_raw:
+                    cleaned_by_raw[raw_content] = cls.clean_html_content(raw_content)
+                cleaned_content = cleaned_by_raw[raw_content]
                 cleaned_item[field] = cleaned_content
                 
                 # Calculate additional metadata
                 if cleaned_content:
-                    cleaned_item['word_count'] = len(cleaned_content.split())
-                    cleaned_item['reading_time_minutes'] = cls.calculate_reading_time(cleaned_content)
+                    word_count = len(cleaned_content.split())
+                    cleaned_item['word_count'] = word_count
+                    cleaned_item['reading_time_minutes'] = cls.calculate_reading_time(word_count=word_count)
                     
                     # Generate summary if content is long
                     if field == 'content' and len(cleaned_content) > 300:
@@ -309,6 +419,32 @@ class TextCleaner:
         
         return cleaned_item
 
+# Memo of cleaned bodies keyed by a 16-byte content digest (not the raw HTML),
+# bounded by the total characters of cleaned text it holds
+_CLEAN_MEMO_MAX_CHARS = 8 * 1024 * 1024
+_clean_memo: LRUCache = LRUCache(
+    maxsize=_CLEAN_MEMO_MAX_CHARS,
+    getsizeof=lambda cleaned: len(cleaned) + 1 if cleaned else 1
+)
+_clean_memo_lock = threading.Lock()
+_MISSING = object()
+
+def _clean_html_cached(html_content: str) -> Optional[str]:
+    """Memoized HTML cleaning, keyed on an xxh3-128 digest of the content"""
+    key = xxhash.xxh3_128_digest(html_content.encode('utf-8', 'surrogatepass'))
+    with _clean_memo_lock:
+        cleaned = _clean_memo.get(key, _MISSING)
+    if cleaned is not _MISSING:
+        return cleaned
+    
+    cleaned = TextCleaner._clean_html_impl(html_content)
+    with _clean_memo_lock:
+        try:
+            _clean_memo[key] = cleaned
+        except ValueError:
+            pass  # Larger than the whole memo; don't cache it
+    return cleaned
+
 # Convenience functions
 def clean_html_content(html_content: Optional[str]) -> Optional[str]:
     """Clean HTML content from RSS feeds"""
@@ -14,88 +14,88 @@ sys.path.append('..')
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-async def test_individual_feed(url, name):
+async def test_individual_feed(session, url, name):
     """Test a single RSS feed and provide detailed diagnostics"""
-    print(f"\n🔍 Testing: {name}")
-    print(f"URL: {url}")
+    # Buffer this feed's report so concurrent checks don't interleave their output
+    lines = []
+    report = lines.append
+    
+    report(f"\n🔍 Testing: {name}")
+    report(f"URL: {url}")
     
     try:
-        timeout = aiohttp.ClientTimeout(total=30, connect=10)
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; NewsAggregator/1.0)',
-            'Accept': 'application/rss+xml, application/xml, text/xml, */*',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive'
-        }
-        
-        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
-            async with session.get(url) as response:
-                print(f"📡 HTTP Status: {response.status}")
-                print(f"📄 Content-Type: {response.headers.get('content-type', 'Unknown')}")
-                print(f"📏 Content-Length: {response.headers.get('content-length', 'Unknown')}")
-                
-                if response.status != 200:
-                    print(f"❌ HTTP Error: {response.status}")
-                    # Try to get error content
-                    try:
-                        error_content = await response.text()
-                        print(f"🔍 Error Response Preview: {error_content[:200]}...")
-                    except:
-                        pass
-                    return False
-                
-                content = await response.text()
-                print(f"📊 Content Size: {len(content)} characters")
-                
-                # Show raw content preview for debugging
-                print(f"📄 Raw content preview (first 300 chars):")
-                print(content[:300])
-                print("..." if len(content) > 300 else "")
+        async with session.get(url) as response:
+            report(f"📡 HTTP Status: {response.status}")
+            report(f"📄 Content-Type: {response.headers.get('content-type', 'Unknown')}")
+            report(f"📏 Content-Length: {response.headers.get('content-length', 'Unknown')}")
+            
+            if response.status != 200:
+                report(f"❌ HTTP Error: {response.status}")
+                # Try to get error content
+                try:
+                    error_content = await response.text()
+                    report(f"🔍 Error Response Preview: {error_content[:200]}...")
+                except:
+                    pass
+                return False
+            
+            # Raw bytes: feedparser detects the encoding from the XML declaration/BOM itself
+            raw = await response.read()
+            report(f"📊 Content Size: {len(raw)} bytes")
+            
+            # Show raw content preview for debugging
+            report(f"📄 Raw content preview (first 300 bytes):")
+            report(raw[:300].decode('utf-8', 'replace'))
+            report("..." if len(raw) > 300 else "")
+            
+            # Parse with feedparser
+            feed = feedparser.parse(raw)
+            
+            report(f"📰 Feed Title: {feed.feed.get('title', 'No title')}")  #type: ignore[assignment]
+            report(f"📝 Feed Description: {feed.feed.get('description', 'No description')[:100]}...")  #type: ignore[assignment]
+            report(f"📰 Total Entries: {len(feed.entries)}")
+            
+            if len(feed.entries) == 0:
+                report("❌ No entries found in feed!")
+                report("🔍 Checking for common issues...")
                 
-                # Parse with feedparser
-                feed = feedparser.parse(content)
+                raw_lower = raw.lower()
                 
-                print(f"📰 Feed Title: {feed.feed.get('title', 'No title')}")  #type: ignore[assignment]
-                print(f"📝 Feed Description: {feed.feed.get('description', 'No description')[:100]}...")  #type: ignore[assignment]
-                print(f"📰 Total Entries: {len(feed.entries)}")
+                # Check if it's actually HTML instead of XML
+                if raw_lower.startswith(b'<!doctype') or b'<html' in raw_lower:
+                    report("⚠️  Response is HTML, not XML RSS feed")
                 
-                if len(feed.entries) == 0:
-                    print("❌ No entries found in feed!")
-                    print("🔍 Checking for common issues...")
-                    
-                    # Check if it's actually HTML instead of XML
-                    if content.lower().startswith('<!doctype') or '<html' in content.lower():
-                        print("⚠️  Response is HTML, not XML RSS feed")
-                    
-                    # Check if it's a valid XML structure
-                    if '<?xml' not in content:
-                        print("⚠️  No XML declaration found")
-                    
-                    # Check for RSS/feed tags
-                    if '<rss' not in content.lower() and '<feed' not in content.lower():
-                        print("⚠️  No RSS or Atom feed tags found")
-                    
-                    return False
+                # Check if it's a valid XML structure
+                if b'<?xml' not in raw:
+                    report("⚠️  No XML declaration found")
                 
-                # Show first few entries
-                print(f"📋 Sample entries:")
-                for i, entry in enumerate(feed.entries[:3]):
-                    title = entry.get('title')
-                    if title is None:
-                        title = 'No title'
-                    print(f"  {i+1}. {title[:80]}...")
-                    print(f"     Published: {entry.get('published', 'No date')}")
-                    print(f"     Link: {entry.get('link', 'No link')}")
-                
-                print("✅ Feed is working correctly!")
-                return True
+                # Check for RSS/feed tags
+                if b'<rss' not in raw_lower and b'<feed' not in raw_lower:
+                    report("⚠️  No RSS or Atom feed tags found")
                 
+                return False
+            
+            # Show first few entries
+            report(f"📋 Sample entries:")
+            for i, entry in enumerate(feed.entries[:3]):
+                title = entry.get('title')
+                if title is None:
+                    title = 'No title'
+                report(f"  {i+1}. {title[:80]}...")
+                report(f"     Published: {entry.get('published', 'No date')}")
+                report(f"     Link: {entry.get('link', 'No link')}")
+            
+            report("✅ Feed is working correctly!")
+            return True
+            
     except asyncio.TimeoutError:
-        print("❌ Timeout - Feed took too long to respond")
+        report("❌ Timeout - Feed took too long to respond")
         return False
     except Exception as e:
-        print(f"❌ Error: {e}")
+        report(f"❌ Error: {e}")
         return False
+    finally:
+        print("\n".join(lines))
 
 async def main():
     # Test YOUR EXACT problematic feeds from database query
@@ -114,14 +114,32 @@ async def main():
     working_feeds = []
     broken_feeds = []
     
-    for name, url in problem_feeds:
-        result = await test_individual_feed(url, name)
+    timeout = aiohttp.ClientTimeout(total=30, connect=10)
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (compatible; NewsAggregator/1.0)',
+        'Accept': 'application/rss+xml, application/xml, text/xml, */*',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive'
+    }
+    semaphore = asyncio.Semaphore(4)
+    
+    async def bounded_test(session, name, url):
+        async with semaphore:
+            result = await test_individual_feed(session, url, name)
+            await asyncio.sleep(2)  # Be respectful to servers
+            return result
+    
+    # One shared session (connection pool + DNS cache), feeds checked concurrently
+    async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+        results = await asyncio.gather(*[
+            bounded_test(session, name, url) for name, url in problem_feeds
+        ])
+    
+    for (name, url), result in zip(problem_feeds, results):
         if result:
             working_feeds.append((name, url))
         else:
             broken_feeds.append((name, url))
-        
-        await asyncio.sleep(2)  # Be respectful to servers
     
     print(f"\n📊 Summary:")
     print(f"✅ Working feeds: {len(working_feeds)}")
@@ -4,7 +4,6 @@
 import asyncio
 import sys
 import os
-from sqlalchemy import text
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -50,11 +49,14 @@ async def create_extensions():
     
     try:
         async with async_engine.begin() as conn:
-            # Create pgvector extension for future vector similarity search
-         
-            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
-            # Create pg_stat_statements for query performance monitoring
-            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_stat_statements;"))
+            # pgvector for future vector similarity search, pg_stat_statements for query monitoring.
+            # Sent as one simple-protocol query on the raw asyncpg connection: SQLAlchemy's asyncpg
+            # adapter prepares every statement, and prepared statements reject multiple commands.
+            raw_conn = await conn.get_raw_connection()
+            await raw_conn.driver_connection.execute(
+                "CREATE EXTENSION IF NOT EXISTS vector; "
+                "CREATE EXTENSION IF NOT EXISTS pg_stat_statements;"
+            )
             
         logger.info("PostgreSQL extensions created successfully!")
         
@@ -2,11 +2,16 @@
 """Seed database with comprehensive RSS sources - FIXED VERSION"""
 
 import asyncio
+import aiohttp
+import feedparser
+import json
 import sys
 import os
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Set
-from sqlalchemy import select, func, delete
+from typing import Dict, List, Set, Tuple
+from sqlalchemy import select, func, delete, literal_column
+from sqlalchemy.dialects.postgresql import JSONB, insert
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,6 +19,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.database import AsyncSessionLocal
 from app.models.source import NewsSource
 from app.data.rss_sources import get_all_sources, get_source_stats
+from app.utils.helpers import install_uvloop
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -25,31 +31,26 @@ async def cleanup_true_duplicates():
         try:
             logger.info("🧹 Cleaning up TRUE duplicate sources...")
             
-            # Find duplicates by both name AND URL (not just URL)
+            # Rank rows within each (name, URL) group, newest first
+            ranked = select(
+                NewsSource.id,
+                func.row_number().over(
+                    partition_by=[NewsSource.name, NewsSource.url],
+                    order_by=NewsSource.created_at.desc()
+                ).label('rn')
+            ).subquery()
+            
+            # Delete every TRUE duplicate (same name AND URL) in one statement, keeping the newest row
             result = await session.execute(
-                select(NewsSource.name, NewsSource.url, func.count(NewsSource.id).label('count'))
-                .group_by(NewsSource.name, NewsSource.url)
-                .having(func.count(NewsSource.id) > 1)
+                delete(NewsSource)
+                .where(NewsSource.id.in_(select(ranked.c.id).where(ranked.c.rn > 1)))
+                .returning(NewsSource.id, NewsSource.name)
             )
             
-            duplicate_pairs = [(row.name, row.url) for row in result.fetchall()]
-            removed_count = 0
-            
-            for name, url in duplicate_pairs:
-                # Get all sources with this exact name AND URL combination
-                result = await session.execute(
-                    select(NewsSource)
-                    .filter(NewsSource.name == name, NewsSource.url == url)
-                    .order_by(NewsSource.created_at.desc())  # Keep the newest
-                )
-                
-                sources = list(result.scalars().all())
-                if len(sources) > 1:
-                    # Remove all but the first (newest)
-                    for source in sources[1:]:
-                        await session.delete(source)
-                        removed_count += 1
-                        logger.info(f"   Removed TRUE duplicate: {source.name} ({source.id})")
+            removed = result.fetchall()
+            removed_count = len(removed)
+            for row in removed:
+                logger.info(f"   Removed TRUE duplicate: {row.name} ({row.id})")
             
             await session.commit()
             logger.info(f"✅ Removed {removed_count} TRUE duplicate sources")
@@ -59,10 +60,44 @@ async def cleanup_true_duplicates():
             logger.error(f"❌ Cleanup failed: {e}")
             raise
 
-async def create_unique_source_key(source_data: Dict) -> str:
-    """Create unique key for source identification"""
+def source_key(source_data: Dict) -> Tuple[str, str, str]:
+    """Unique key for source identification"""
     # Use name + URL + category to differentiate legitimate multiple feeds
-    return f"{source_data['name']}||{source_data['url']}||{source_data.get('category', 'unknown')}"
+    return (source_data['name'], source_data['url'], source_data.get('category', 'unknown'))
+
+async def copy_sources_into_table(session, rows: List[Dict]):
+    """Bulk load source rows with asyncpg's COPY, bypassing per-row INSERT parse/plan"""
+    table = NewsSource.__table__
+    
+    # COPY skips SQLAlchemy's Python-side defaults, so resolve them here
+    defaults = {
+        column.name: column.default
+        for column in table.columns
+        if column.default is not None and column.name not in rows[0]
+    }
+    columns = list(rows[0]) + list(defaults)
+    json_columns = {column.name for column in table.columns if isinstance(column.type, JSONB)}
+    
+    records = []
+    for row in rows:
+        values = {
+            **row,
+            **{
+                name: default.arg(None) if default.is_callable else default.arg
+                for name, default in defaults.items()
+            }
+        }
+        records.append(tuple(
+            json.dumps(values[name]) if name in json_columns else values[name]
+            for name in columns
+        ))
+    
+    # Runs on the session's connection, inside its transaction
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table.name, records=records, columns=columns
+    )
 
 async def seed_sources():
     """Add comprehensive RSS sources with proper duplicate handling"""
@@ -79,73 +114,69 @@ async def seed_sources():
                     source['url'] = 'https://www.entrepreneur.com/india/feed'
                     logger.info("🔧 Fixed Entrepreneur India URL")
             
-            # Bulk load existing sources
-            result = await session.execute(select(NewsSource))
-            existing_sources = {}
-            for source in result.scalars().all():
-                key = f"{source.name}||{source.url}||{getattr(source, 'category', 'unknown')}"
-                existing_sources[key] = source
-            
-            logger.info(f"Found {len(existing_sources)} existing sources in database")
-            
-            # Create unique sources map with enhanced key
+            # Create unique sources map with enhanced key (first occurrence wins)
             unique_sources = {}
-            duplicate_info = []
-            
             for source_data in all_sources:
-                key = await create_unique_source_key(source_data)
-                
-                if key in unique_sources:
-                    duplicate_info.append({
-                        'name': source_data['name'],
-                        'url': source_data['url'],
-                        'category': source_data.get('category', 'unknown')
-                    })
-                    logger.warning(f"⚠️  True duplicate found in data: {source_data['name']} - {source_data['url']}")
-                    continue
-                    
-                unique_sources[key] = source_data
+                unique_sources.setdefault(source_key(source_data), source_data)
+            
+            # Only walk the list again to report duplicates when there are any
+            duplicate_info = []
+            if len(unique_sources) != len(all_sources):
+                kept = {id(source_data) for source_data in unique_sources.values()}
+                for source_data in all_sources:
+                    if id(source_data) not in kept:
+                        duplicate_info.append({
+                            'name': source_data['name'],
+                            'url': source_data['url'],
+                            'category': source_data.get('category', 'unknown')
+                        })
+                        logger.warning(f"⚠️  True duplicate found in data: {source_data['name']} - {source_data['url']}")
             
             logger.info(f"After deduplication: {len(unique_sources)} unique sources to process")
             if duplicate_info:
                 logger.info(f"Found {len(duplicate_info)} true duplicates in source data")
             
+            # Upsert every source in one statement, keyed on the unique feed URL
+            # (one row per URL: ON CONFLICT cannot touch the same row twice in a statement)
+            now = datetime.utcnow()
+            rows = list({
+                source_data['url']: {
+                    **source_data,
+                    'next_poll_at': now + timedelta(minutes=source_data.get('poll_frequency_minutes', 15))
+                }
+                for source_data in unique_sources.values()
+            }.values())
+            
             added_count = 0
             updated_count = 0
-            skipped_count = 0
             
-            for key, source_data in unique_sources.items():
-                try:
-                    existing_source = existing_sources.get(key)
-                    
-                    if existing_source:
-                        # Update existing source
-                        updated = False
-                        for field, value in source_data.items():
-                            if hasattr(existing_source, field) and getattr(existing_source, field) != value:
-                                setattr(existing_source, field, value)
-                                updated = True
-                        
-                        # Always update next poll time
-                        existing_source.next_poll_at = datetime.utcnow() + timedelta(
-                            minutes=source_data.get('poll_frequency_minutes', 15)
-                        )
-                        
-                        if updated:
-                            updated_count += 1
-                            logger.info(f"Updated source: {source_data['name']} ({source_data.get('category', '')})")
-                        else:
-                            skipped_count += 1
-                    else:
-                        # Create new source
-                        source = NewsSource(**source_data)
-                        session.add(source)
+            # Cold seed: stream straight into the empty table over the COPY protocol
+            if rows and await session.scalar(select(NewsSource.id).limit(1)) is None:
+                await copy_sources_into_table(session, rows)
+                added_count = len(rows)
+                logger.info(f"Added {added_count} new sources via COPY into empty table")
+            elif rows:
+                stmt = insert(NewsSource).values(rows)
+                # Only overwrite the seeded fields; polling stats and caching headers are left intact
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[NewsSource.url],
+                    set_={
+                        **{field: stmt.excluded[field] for field in rows[0] if field != 'url'},
+                        'updated_at': func.now()
+                    }
+                ).returning(
+                    NewsSource.name,
+                    # xmax is 0 only for freshly inserted tuples
+                    literal_column('xmax = 0').label('inserted')
+                )
+                
+                result = await session.execute(stmt)
+                for row in result:
+                    if row.inserted:
                         added_count += 1
-                        logger.info(f"Added new source: {source_data['name']} ({source_data.get('category', '')})")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error processing source {source_data.get('name', 'Unknown')}: {e}")
-                    continue
+                        logger.info(f"Added new source: {row.name}")
+                    else:
+                        updated_count += 1
             
             await session.commit()
             
@@ -154,7 +185,6 @@ async def seed_sources():
             logger.info(f"📊 Summary:")
             logger.info(f"   • New sources added: {added_count}")
             logger.info(f"   • Existing sources updated: {updated_count}")
-            logger.info(f"   • Sources skipped (no changes): {skipped_count}")
             logger.info(f"   • Total unique sources processed: {len(unique_sources)}")
             
             # Show legitimate multiple feeds
@@ -167,7 +197,6 @@ async def seed_sources():
             return {
                 'added': added_count,
                 'updated': updated_count,
-                'skipped': skipped_count,
                 'total_processed': len(unique_sources),
                 'legitimate_multiples': len(legitimate_multiples)
             }
@@ -178,33 +207,36 @@ async def seed_sources():
             raise
 
 async def get_legitimate_multiple_feeds():
-    """Identify sources with multiple legitimate feeds - FIXED VERSION"""
+    """Identify sources with multiple legitimate feeds in a single query"""
     async with AsyncSessionLocal() as session:
-        result = await session.execute(
-            select(NewsSource.name, func.count(NewsSource.id).label('count'))
+        multi_feed_names = (
+            select(NewsSource.name)
             .group_by(NewsSource.name)
             .having(func.count(NewsSource.id) > 1)
         )
+        # Only the two columns the report needs: no ORM hydration, rows streamed in batches
+        result = await session.stream(
+            select(NewsSource.name, NewsSource.topics)
+            .where(NewsSource.name.in_(multi_feed_names))
+            .execution_options(yield_per=500)
+        )
+        
+        # Group topic lists by name in one pass over the stream
+        topics_by_name = defaultdict(list)
+        async for name, topics in result:
+            topics_by_name[name].append(topics)
         
         multiple_feeds = []
-        for row in result.fetchall():
-            # 🔧 FIX: Get full NewsSource objects, not just columns
-            sources_result = await session.execute(
-                select(NewsSource)  # ← Changed from select(NewsSource.url, NewsSource.topics)
-                .filter(NewsSource.name == row.name)
-            )
-            
-            sources = list(sources_result.scalars().all())  # ← Now these are NewsSource objects
+        for name, topic_lists in topics_by_name.items():
             feed_types = []
             
-            for source in sources:
-                # 🔧 FIX: Now we can safely access .topics because source is a NewsSource object
-                if source.topics is not None and isinstance(source.topics, list):
-                    feed_types.extend(source.topics[:2])  # First 2 topics
+            for topics in topic_lists:
+                if topics is not None and isinstance(topics, list):
+                    feed_types.extend(topics[:2])  # First 2 topics
                     
             multiple_feeds.append({
-                'name': row.name,
-                'count': row.count,
+                'name': name,
+                'count': len(topic_lists),
                 'types': list(set(feed_types))[:3]  # Unique types, max 3
             })
             
@@ -222,75 +254,81 @@ async def enhanced_rss_content_extraction():
         "https://www.entrepreneur.com/latest.rss"
     ]
     
-    import aiohttp
-    import feedparser
+    async def fetch_feed(session, feed_url):
+        async with session.get(feed_url) as response:
+            if response.status != 200:
+                return None
+            content = await response.text()
+        # Parse off the event loop so the other fetches keep progressing
+        return await asyncio.to_thread(feedparser.parse, content)
     
-    for feed_url in test_feeds:
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url) as response:
-                    if response.status == 200:
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-                        
-                        if feed.entries:
-                            entry = feed.entries[0]
-                            
-                            # Check different content fields
-                            content_fields = {
-                                'content': getattr(entry, 'content', None),
-                                'description': getattr(entry, 'description', None),
-                                'summary': getattr(entry, 'summary', None),
-                                'subtitle': getattr(entry, 'subtitle', None)
-                            }
-                            
-                            logger.info(f"📰 Feed: {feed_url}")
-                            for field, value in content_fields.items():
-                                if value:
-                                    if isinstance(value, list):
-                                        logger.info(f"   {field}: List with {len(value)} items")
-                                        if value:
-                                            logger.info(f"   {field}[0]: {str(value[0])[:100]}...")
-                                    else:
-                                        logger.info(f"   {field}: {str(value)[:100]}...")
-                                else:
-                                    logger.info(f"   {field}: None")
-                            logger.info("")
-        except Exception as e:
-            logger.error(f"❌ Error testing {feed_url}: {e}")
+    # One shared session fetches every test feed concurrently
+    connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        results = await asyncio.gather(
+            *(fetch_feed(session, feed_url) for feed_url in test_feeds),
+            return_exceptions=True
+        )
+    
+    # Report in feed order so the log output stays readable
+    for feed_url, feed in zip(test_feeds, results):
+        if isinstance(feed, Exception):
+            logger.error(f"❌ Error testing {feed_url}: {feed}")
+            continue
+        
+        if feed is not None and feed.entries:
+            entry = feed.entries[0]
+            
+            # Check different content fields
+            content_fields = {
+                'content': getattr(entry, 'content', None),
+                'description': getattr(entry, 'description', None),
+                'summary': getattr(entry, 'summary', None),
+                'subtitle': getattr(entry, 'subtitle', None)
+            }
+            
+            logger.info(f"📰 Feed: {feed_url}")
+            for field, value in content_fields.items():
+                if value:
+                    if isinstance(value, list):
+                        logger.info(f"   {field}: List with {len(value)} items")
+                        if value:
+                            logger.info(f"   {field}[0]: {str(value[0])[:100]}...")
+                    else:
+                        logger.info(f"   {field}: {str(value)[:100]}...")
+                else:
+                    logger.info(f"   {field}: None")
+            logger.info("")
 
 async def verify_seeded_data():
     """Enhanced verification with duplicate analysis"""
     async with AsyncSessionLocal() as session:
         try:
-            # Count total sources
-            result = await session.execute(select(func.count(NewsSource.id)))
-            total_count = result.scalar()
-            
-            # Count by region
+            # Total, enabled and per-region counts in one grouped scan
             result = await session.execute(
-                select(NewsSource.primary_region, func.count(NewsSource.id))
+                select(
+                    NewsSource.primary_region,
+                    func.count(NewsSource.id).label('total'),
+                    func.count(NewsSource.id).filter(NewsSource.enabled.is_(True)).label('enabled')
+                )
                 .group_by(NewsSource.primary_region)
             )
-            region_counts = dict(result.fetchall())
+            region_rows = result.fetchall()
+            region_counts = {row.primary_region: row.total for row in region_rows}
+            total_count = sum(row.total for row in region_rows)
+            enabled_count = sum(row.enabled for row in region_rows)
             
-            # Count enabled sources
-            result = await session.execute(
-                select(func.count(NewsSource.id))
-                .where(NewsSource.enabled.is_(True))
+            # Check for TRUE duplicates (same name + same URL) and legitimate multiple feeds
+            # concurrently; the latter runs on its own session
+            duplicates_result, legitimate_multiples = await asyncio.gather(
+                session.execute(
+                    select(NewsSource.name, NewsSource.url, func.count(NewsSource.id).label('count'))
+                    .group_by(NewsSource.name, NewsSource.url)
+                    .having(func.count(NewsSource.id) > 1)
+                ),
+                get_legitimate_multiple_feeds()
             )
-            enabled_count = result.scalar()
-            
-            # Check for TRUE duplicates (same name + same URL)
-            result = await session.execute(
-                select(NewsSource.name, NewsSource.url, func.count(NewsSource.id).label('count'))
-                .group_by(NewsSource.name, NewsSource.url)
-                .having(func.count(NewsSource.id) > 1)
-            )
-            true_duplicates = result.fetchall()
-            
-            # Check legitimate multiple feeds
-            legitimate_multiples = await get_legitimate_multiple_feeds()
+            true_duplicates = duplicates_result.fetchall()
             
             logger.info("🔍 Database Verification:")
             logger.info(f"   • Total sources in database: {total_count}")
@@ -359,4 +397,5 @@ async def main():
         raise
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
@@ -8,7 +8,7 @@ import sys
 import subprocess
 import signal
 import time
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -31,20 +31,36 @@ def check_redis_connection() -> bool:
         print(f"❌ Redis connection failed: {e}")
         return False
 
+# Queues whose tasks spend their time waiting on HTTP; the AsyncIOPool can
+# interleave far more of these per process than CPU-bound queues
+IO_BOUND_QUEUES = {'rss_collection', 'rss_sources'}
+IO_BOUND_CONCURRENCY = 100
+DEFAULT_CONCURRENCY = 4
+
+def default_concurrency(queues: List[str]) -> int:
+    """Pick worker concurrency from the queue mix"""
+    if set(queues) <= IO_BOUND_QUEUES:
+        return IO_BOUND_CONCURRENCY
+    return DEFAULT_CONCURRENCY
+
 def start_celery_worker(queues: Optional[List[str]] = None, 
-                       concurrency: int = 4,
+                       concurrency: Optional[int] = None,
                        log_level: str = "info") -> subprocess.Popen:
     """Start Celery worker process"""
     
     if queues is None:
         queues = ['default', 'rss_collection', 'rss_sources', 'content_processing', 'maintenance']
     
+    if concurrency is None:
+        concurrency = default_concurrency(queues)
+    
     cmd = [
         'celery', '-A', 'app.tasks.celery_app:celery_app', 'worker',
         '--queues', ','.join(queues),
         '--concurrency', str(concurrency),
         '--loglevel', log_level,
-        '--pool', 'solo'
+        # No --pool override: tasks are native coroutines and need the
+        # AsyncIOPool configured on the app (solo cannot await them)
     ]
     
     print(f"🚀 Starting Celery worker: {' '.join(cmd)}")
@@ -80,6 +96,57 @@ def start_celery_flower(port: int = 5555) -> subprocess.Popen:
     
     return subprocess.Popen(cmd)
 
+def find_dead_process(processes: List[Tuple[str, subprocess.Popen]]) -> Optional[Tuple[str, subprocess.Popen]]:
+    """Return the first child that has exited, if any"""
+    for name, process in processes:
+        if process.poll() is not None:
+            return name, process
+    return None
+
+def wait_for_exit_or_signal(processes: List[Tuple[str, subprocess.Popen]]) -> Optional[Tuple[str, subprocess.Popen]]:
+    """Block until a child exits (returned) or SIGINT/SIGTERM arrives (None)"""
+    if not hasattr(signal, 'sigwait'):
+        # Windows has no sigwait: fall back to polling, Ctrl+C raises KeyboardInterrupt
+        while True:
+            time.sleep(1)
+            dead = find_dead_process(processes)
+            if dead is not None:
+                return dead
+    
+    wait_signals = {signal.SIGINT, signal.SIGTERM, signal.SIGCHLD}
+    # SIGCHLD is discarded under its default disposition; a no-op handler keeps it deliverable.
+    # Signals are blocked only now, after the children were spawned, so they do not inherit the mask
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+    signal.pthread_sigmask(signal.SIG_BLOCK, wait_signals)
+    
+    while True:
+        # Also catches children that exited before the mask was installed
+        dead = find_dead_process(processes)
+        if dead is not None:
+            return dead
+        if signal.sigwait(wait_signals) != signal.SIGCHLD:
+            return None
+
+def stop_processes(processes: List[Tuple[str, subprocess.Popen]]):
+    """Terminate all child processes, force killing stragglers"""
+    print("\n🛑 Shutting down Celery processes...")
+    
+    for name, process in processes:
+        print(f"   Stopping {name} (PID {process.pid})...")
+        process.terminate()
+    
+    # Wait for graceful shutdown (5s overall), force killing stragglers
+    deadline = time.monotonic() + 5
+    for name, process in processes:
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            print(f"   Force killing {name}...")
+            process.kill()
+            process.wait()
+    
+    print("✅ All processes stopped")
+
 def main():
     """Main startup function"""
     print("🚀 Starting Celery infrastructure...")
@@ -95,7 +162,8 @@ def main():
     parser.add_argument('--worker-only', action='store_true', help='Start worker only')
     parser.add_argument('--beat-only', action='store_true', help='Start beat only')
     parser.add_argument('--with-flower', action='store_true', help='Start Flower monitoring')
-    parser.add_argument('--concurrency', type=int, default=4, help='Worker concurrency')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help=f'Worker concurrency (default: {IO_BOUND_CONCURRENCY} for RSS-only queues, else {DEFAULT_CONCURRENCY})')
     parser.add_argument('--log-level', default='info', help='Log level')
     parser.add_argument('--queues', nargs='+', help='Queues to process')
     
@@ -141,31 +209,15 @@ def main():
         print("\n⏹️  Press Ctrl+C to stop all processes")
         
         # Wait for processes and handle shutdown
-        while True:
-            time.sleep(1)
-            # Check if any process died
-            for name, process in processes:
-                if process.poll() is not None:
-                    print(f"❌ Process {name} (PID {process.pid}) died with code {process.returncode}")
-                    return
+        dead = wait_for_exit_or_signal(processes)
+        if dead is not None:
+            name, process = dead
+            print(f"❌ Process {name} (PID {process.pid}) died with code {process.returncode}")
+            return
+        stop_processes(processes)
     
     except KeyboardInterrupt:
-        print("\n🛑 Shutting down Celery processes...")
-        
-        for name, process in processes:
-            print(f"   Stopping {name} (PID {process.pid})...")
-            process.terminate()
-        
-        # Wait for graceful shutdown
-        time.sleep(5)
-        
-        # Force kill if necessary
-        for name, process in processes:
-            if process.poll() is None:
-                print(f"   Force killing {name}...")
-                process.kill()
-        
-        print("✅ All processes stopped")
+        stop_processes(processes)
     
     except Exception as e:
         print(f"❌ Error starting Celery: {e}")
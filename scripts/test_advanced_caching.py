@@ -2,6 +2,7 @@
 """Test Advanced Caching System"""
 
 import asyncio
+import aiohttp
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -10,9 +11,12 @@ from app.services.cache_manager import cache_manager, get_cache_stats
 from app.database import AsyncSessionLocal
 from app.models.article import Article
 from app.models.source import NewsSource
+from app.utils.helpers import install_uvloop
 from sqlalchemy import select, func
 from datetime import datetime
 
+API_BASE_URL = "http://localhost:8000"
+
 async def test_cache_layers():
     """Test all 5 cache layers"""
     print("🧪 Testing Advanced Multi-Layer Caching System\n")
@@ -80,49 +84,53 @@ async def test_cache_layers():
     
     return analytics
 
-async def test_cache_integration():
+async def test_cache_integration(session: aiohttp.ClientSession):
     """Test cache integration with RSS collection"""
     print("\n🔗 Testing Cache Integration...")
     
     # Trigger RSS collection (which should use caching)
-    import requests
     try:
-        response = requests.get("http://localhost:8000/api/tasks/rss/trigger")
-        if response.status_code == 200:
-            task_data = response.json()
-            print(f"   ✅ RSS collection triggered: {task_data.get('task_id')}")
-            
-            # Wait a bit for task completion
-            await asyncio.sleep(15)
-            
-            # Check cache stats after collection
-            response = requests.get("http://localhost:8000/api/cache/stats")
-            if response.status_code == 200:
-                stats = response.json()
+        async with session.get(f"{API_BASE_URL}/api/tasks/rss/trigger") as response:
+            if response.status != 200:
+                print(f"   ❌ RSS trigger failed: {response.status}")
+                return
+            task_data = await response.json()
+        print(f"   ✅ RSS collection triggered: {task_data.get('task_id')}")
+        
+        # Wait a bit for task completion
+        await asyncio.sleep(15)
+        
+        # Check cache stats after collection
+        async with session.get(f"{API_BASE_URL}/api/cache/stats") as response:
+            if response.status == 200:
+                stats = await response.json()
                 print(f"   ✅ Cache stats after RSS collection: {stats}")
-        else:
-            print(f"   ❌ RSS trigger failed: {response.status_code}")
     except Exception as e:
         print(f"   ⚠️ Integration test skipped (FastAPI not running): {e}")
 
-async def test_cached_retrieval():
+async def fetch_json(session: aiohttp.ClientSession, path: str):
+    """GET an API path, returning the decoded JSON or None on a non-200"""
+    async with session.get(f"{API_BASE_URL}{path}") as response:
+        if response.status != 200:
+            return None
+        return await response.json()
+
+async def test_cached_retrieval(session: aiohttp.ClientSession):
     """Test smart cached article retrieval"""
     print("\n🎯 Testing Smart Cached Retrieval...")
     
-    # Test cached articles endpoint
-    import requests
+    # Test topic-based and recency-based retrieval concurrently
     try:
-        # Test topic-based retrieval
-        response = requests.get("http://localhost:8000/api/articles/cached?topic=technology&limit=5")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ Cached tech articles: {data.get('total', 0)} articles, source: {data.get('source')}")
+        topic_data, recent_data = await asyncio.gather(
+            fetch_json(session, "/api/articles/cached?topic=technology&limit=5"),
+            fetch_json(session, "/api/articles/cached?time_bucket=1h&limit=5")
+        )
+        
+        if topic_data is not None:
+            print(f"   ✅ Cached tech articles: {topic_data.get('total', 0)} articles, source: {topic_data.get('source')}")
         
-        # Test recency-based retrieval
-        response = requests.get("http://localhost:8000/api/articles/cached?time_bucket=1h&limit=5")
-        if response.status_code == 200:
-            data = response.json()
-            print(f"   ✅ Cached recent articles: {data.get('total', 0)} articles, source: {data.get('source')}")
+        if recent_data is not None:
+            print(f"   ✅ Cached recent articles: {recent_data.get('total', 0)} articles, source: {recent_data.get('source')}")
             
     except Exception as e:
         print(f"   ⚠️ API tests skipped: {e}")
@@ -135,11 +143,12 @@ async def main():
         # Run core cache tests
         analytics = await test_cache_layers()
         
-        # Test integration
-        await test_cache_integration()
-        
-        # Test retrieval
-        await test_cached_retrieval()
+        async with aiohttp.ClientSession() as session:
+            # Test integration
+            await test_cache_integration(session)
+            
+            # Test retrieval
+            await test_cached_retrieval(session)
         
         # Final performance summary
         end_time = datetime.utcnow()
@@ -160,5 +169,6 @@ async def main():
     return True
 
 if __name__ == "__main__":
+    install_uvloop()
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
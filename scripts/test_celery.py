@@ -10,7 +10,12 @@ from datetime import datetime
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.tasks import celery_app, collect_all_rss_sources, get_active_tasks
-from app.utils.redis_client import get_redis_client
+from app.utils.redis_client import get_redis_client, close_redis_client
+
+def write_lines(lines):
+    """Emit a report section with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 def test_redis_connection():
     """Test Redis connection"""
@@ -27,10 +32,13 @@ def test_redis_connection():
             return True
         else:
             print(f"❌ Redis unhealthy: {health}")
+            # Drop the shared client so the next probe reconnects with a fresh pool
+            close_redis_client()
             return False
     
     except Exception as e:
         print(f"❌ Redis test failed: {e}")
+        close_redis_client()
         return False
 
 def test_celery_connection():
@@ -38,8 +46,8 @@ def test_celery_connection():
     print("\n🔧 Testing Celery connection...")
     
     try:
-        # Test basic connection
-        inspect = celery_app.control.inspect()
+        # Test basic connection (replies from live workers arrive well within 0.5s; the default waits 1s)
+        inspect = celery_app.control.inspect(timeout=0.5)
         stats = inspect.stats()
         
         if stats:
@@ -69,24 +77,21 @@ def test_task_registration():
         'app.tasks.rss_tasks.health_check_sources'
     ]
     
-    registered_tasks = list(celery_app.tasks.keys())
-    
-    print(f"📊 Total registered tasks: {len(registered_tasks)}")
+    registered_tasks = frozenset(celery_app.tasks.keys())
     
-    missing_tasks = []
-    for task in expected_tasks:
-        if task in registered_tasks:
-            print(f"✅ {task}")
-        else:
-            print(f"❌ {task} - NOT FOUND")
-            missing_tasks.append(task)
+    expected = frozenset(expected_tasks)
+    missing_tasks = sorted(expected - registered_tasks)
     
+    lines = [f"📊 Total registered tasks: {len(registered_tasks)}"]
+    lines += [f"✅ {task}" for task in sorted(expected & registered_tasks)]
+    lines += [f"❌ {task} - NOT FOUND" for task in missing_tasks]
     if missing_tasks:
-        print(f"\n⚠️  Missing {len(missing_tasks)} expected tasks")
-        return False
+        lines.append(f"\n⚠️  Missing {len(missing_tasks)} expected tasks")
     else:
-        print("\n✅ All expected tasks registered")
-        return True
+        lines.append("\n✅ All expected tasks registered")
+    write_lines(lines)
+    
+    return not missing_tasks
 
 def test_task_execution():
     """Test actual task execution"""
@@ -100,9 +105,9 @@ def test_task_execution():
         print(f"   Task ID: {result.id}")
         print("   Waiting for result (timeout: 30s)...")
         
-        # Wait for result with timeout
+        # Wait for result with timeout (poll every 50ms on polling backends instead of 500ms)
         try:
-            task_result = result.get(timeout=30)
+            task_result = result.get(timeout=30, interval=0.05)
             print(f"✅ Task completed successfully: {task_result}")
             return True
         except Exception as e:
@@ -126,23 +131,22 @@ def test_scheduled_tasks():
         'health-check-hourly'
     ]
     
-    print(f"📅 Configured schedules: {len(beat_schedule)}")
-    
-    missing_schedules = []
-    for schedule_name in expected_schedules:
-        if schedule_name in beat_schedule:
-            schedule = beat_schedule[schedule_name]
-            print(f"✅ {schedule_name}: {schedule['task']}")
-        else:
-            print(f"❌ {schedule_name} - NOT FOUND")
-            missing_schedules.append(schedule_name)
+    expected = frozenset(expected_schedules)
+    missing_schedules = sorted(expected - beat_schedule.keys())
     
+    lines = [f"📅 Configured schedules: {len(beat_schedule)}"]
+    lines += [
+        f"✅ {schedule_name}: {beat_schedule[schedule_name]['task']}"
+        for schedule_name in sorted(expected & beat_schedule.keys())
+    ]
+    lines += [f"❌ {schedule_name} - NOT FOUND" for schedule_name in missing_schedules]
     if missing_schedules:
-        print(f"\n⚠️  Missing {len(missing_schedules)} expected schedules")
-        return False
+        lines.append(f"\n⚠️  Missing {len(missing_schedules)} expected schedules")
     else:
-        print("\n✅ All expected schedules configured")
-        return True
+        lines.append("\n✅ All expected schedules configured")
+    write_lines(lines)
+    
+    return not missing_schedules
 
 def test_queue_configuration():
     """Test queue configuration"""
@@ -152,27 +156,31 @@ def test_queue_configuration():
     
     expected_queues = ['default', 'rss_collection', 'rss_sources', 'content_processing', 'maintenance']
     
-    print(f"📋 Configured queues: {len(queues)}")
-    
-    queue_names = [q.name for q in queues]
-    missing_queues = []
-    
-    for queue_name in expected_queues:
-        if queue_name in queue_names:
-            print(f"✅ {queue_name}")
-        else:
-            print(f"❌ {queue_name} - NOT FOUND")
-            missing_queues.append(queue_name)
+    queue_names = frozenset(q.name for q in queues)
+    expected = frozenset(expected_queues)
+    missing_queues = sorted(expected - queue_names)
     
+    lines = [f"📋 Configured queues: {len(queues)}"]
+    lines += [f"✅ {queue_name}" for queue_name in sorted(expected & queue_names)]
+    lines += [f"❌ {queue_name} - NOT FOUND" for queue_name in missing_queues]
     if missing_queues:
-        print(f"\n⚠️  Missing {len(missing_queues)} expected queues")
-        return False
+        lines.append(f"\n⚠️  Missing {len(missing_queues)} expected queues")
     else:
-        print("\n✅ All expected queues configured")
-        return True
+        lines.append("\n✅ All expected queues configured")
+    write_lines(lines)
+    
+    return not missing_queues
 
 def main():
     """Main test function"""
+    # Parse command line arguments
+    import argparse
+    parser = argparse.ArgumentParser(description='Test Celery setup and task execution')
+    parser.add_argument('--fast', action='store_true',
+                        help='Skip the task execution test (waits up to 30s for a worker); also CELERY_TEST_FAST=1')
+    args = parser.parse_args()
+    fast = args.fast or os.getenv('CELERY_TEST_FAST', '').lower() in ('1', 'true', 'yes')
+    
     print("🧪 Testing Celery Setup - Priority 1")
     print(f"📅 Test Date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
     print("="*70)
@@ -193,17 +201,22 @@ def main():
     
     # Optional task execution test (only if workers are running)
     print(f"\n{'='*20} Task Execution (Optional) {'='*20}")
-    print("⚠️  This test requires active Celery workers")
     
-    try:
-        if test_task_execution():
-            results["Task Execution"] = True
-        else:
-            print("   This is expected if no workers are running")
-            results["Task Execution"] = "N/A"
-    except Exception as e:
-        print(f"   Task execution test skipped: {e}")
+    if fast:
+        print("   Task execution test skipped (--fast)")
         results["Task Execution"] = "N/A"
+    else:
+        print("⚠️  This test requires active Celery workers")
+        
+        try:
+            if test_task_execution():
+                results["Task Execution"] = True
+            else:
+                print("   This is expected if no workers are running")
+                results["Task Execution"] = "N/A"
+        except Exception as e:
+            print(f"   Task execution test skipped: {e}")
+            results["Task Execution"] = "N/A"
     
     # Summary
     print("\n" + "="*70)
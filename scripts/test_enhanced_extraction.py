@@ -2,14 +2,70 @@
 """Test enhanced content extraction"""
 
 import asyncio
+import heapq
 import aiohttp
 import feedparser
 import sys
 import os
+from typing import List
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.rss_collector import RSSCollector
+from app.models.source import NewsSource
+from app.utils.helpers import install_uvloop
+
+async def probe(collector: RSSCollector, name: str, url: str) -> List[str]:
+    """Fetch and extract one feed, returning its report lines"""
+    lines = [f"\n🔍 Testing: {name}", f"URL: {url}"]
+    report = lines.append
+    
+    try:
+        # Fetch feed
+        feed_data = await collector._fetch_rss_with_retry(NewsSource(name=name, url=url))
+        
+        if feed_data:
+            # Parse off the event loop so the other probes keep fetching
+            feed = await asyncio.to_thread(feedparser.parse, feed_data)
+            report(f"📰 Feed entries found: {len(feed.entries)}")
+            
+            if feed.entries:
+                entry = feed.entries[0]
+                
+                # Test enhanced extraction
+                content = collector._extract_entry_content(entry)
+                
+                report(f"📄 Content extracted: {len(content)} characters")
+                if content:
+                    report(f"📝 Content preview: {content[:200]}...")
+                    
+                    # Show content quality
+                    if len(content) > 500:
+                        report("✅ Good content length")
+                    elif len(content) > 100:
+                        report("⚠️  Moderate content length")
+                    else:
+                        report("❌ Short content")
+                else:
+                    report("❌ No content extracted")
+                    
+                    # Debug: show what fields are available
+                    report("🔍 Available fields:")
+                    # FeedParserDict is a dict: its keys are exactly the parsed feed fields.
+                    # Show only the 5 longest, which are the likeliest content carriers
+                    fields = ((attr, str(value)) for attr, value in entry.items() if value)
+                    longest = heapq.nlargest(5, fields, key=lambda field: len(field[1]))
+                    for attr, text in longest:
+                        if len(text) > 10:
+                            report(f"   {attr}: {text[:100]}...")
+        
+        else:
+            report("❌ Failed to fetch feed")
+            
+    except Exception as e:
+        report(f"❌ Error testing {name}: {e}")
+    
+    return lines
 
 async def test_content_extraction():
     """Test the enhanced content extraction on specific feeds"""
@@ -22,54 +78,18 @@ async def test_content_extraction():
     ]
     
     async with RSSCollector() as collector:
-        for name, url in test_feeds:
-            print(f"\n🔍 Testing: {name}")
-            print(f"URL: {url}")
-            
-            try:
-                # Import NewsSource and create source object
-                from app.models.source import NewsSource
-
-                # Fetch feed
-                feed_data = await collector._fetch_rss_with_retry(NewsSource(name=name, url=url))
-                
-                if feed_data:
-                    feed = feedparser.parse(feed_data)
-                    print(f"📰 Feed entries found: {len(feed.entries)}")
-                    
-                    if feed.entries:
-                        entry = feed.entries[0]
-                        
-                        # Test enhanced extraction
-                        content = collector._extract_entry_content(entry)
-                        
-                        print(f"📄 Content extracted: {len(content)} characters")
-                        if content:
-                            print(f"📝 Content preview: {content[:200]}...")
-                            
-                            # Show content quality
-                            if len(content) > 500:
-                                print("✅ Good content length")
-                            elif len(content) > 100:
-                                print("⚠️  Moderate content length")
-                            else:
-                                print("❌ Short content")
-                        else:
-                            print("❌ No content extracted")
-                            
-                            # Debug: show what fields are available
-                            print("🔍 Available fields:")
-                            for attr in dir(entry):
-                                if not attr.startswith('_') and hasattr(entry, attr):
-                                    value = getattr(entry, attr)
-                                    if value and len(str(value)) > 10:
-                                        print(f"   {attr}: {str(value)[:100]}...")
-                
-                else:
-                    print("❌ Failed to fetch feed")
-                    
-            except Exception as e:
-                print(f"❌ Error testing {name}: {e}")
+        # Fetch all feeds concurrently, then print each report in feed order
+        reports = await asyncio.gather(
+            *(probe(collector, name, url) for name, url in test_feeds),
+            return_exceptions=True
+        )
+    
+    for (name, _), lines in zip(test_feeds, reports):
+        if isinstance(lines, BaseException):
+            print(f"❌ Error testing {name}: {lines}")
+            continue
+        print("\n".join(lines))
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(test_content_extraction())
@@ -8,6 +8,7 @@ import asyncio
 import sys
 import os
 from datetime import datetime
+from typing import List
 
 # Add the parent directory to the path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -15,17 +16,19 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.services.content_processor import process_articles, ContentProcessor
 from app.services.deduplicator import deduplicate_articles, ArticleDeduplicator
 from app.utils.hash_generator import (
-    generate_content_hash, 
     generate_batch_hashes, 
     calculate_hash_quality_metrics
 )
 from app.database import AsyncSessionLocal
 from app.models.article import Article
-from sqlalchemy import select, func
+from sqlalchemy import JSON, Numeric, cast, select, func
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 async def test_hash_generation():
     """Test hash generation functionality"""
-    print("🔧 Testing Hash Generation...")
+    lines: List[str] = []
+    report = lines.append
+    report("🔧 Testing Hash Generation...")
     
     # Test basic hash generation
     test_articles = [
@@ -34,27 +37,27 @@ async def test_hash_generation():
         {"title": "Meta Launches New VR Headset", "url": "https://theverge.com/meta-vr", "content": "Meta unveiled..."},
     ]
     
-    print(f"   Testing {len(test_articles)} sample articles...")
+    report(f"   Testing {len(test_articles)} sample articles...")
     
-    # Generate individual hashes
-    for i, article in enumerate(test_articles):
-        hash_val = generate_content_hash(article["title"], article["url"], article["content"])
-        print(f"   Article {i+1} hash: {hash_val[:8]}...")
-    
-    # Test batch generation
+    # Test batch generation (one pass over all articles)
     batch_hashes = generate_batch_hashes(test_articles)
-    print(f"   Batch generated {len(batch_hashes)} hashes")
+    for i, hash_val in batch_hashes.items():
+        report(f"   Article {i+1} hash: {hash_val[:8]}...")
+    report(f"   Batch generated {len(batch_hashes)} hashes")
     
     # Test hash quality metrics
     all_hashes = list(batch_hashes.values())
     metrics = calculate_hash_quality_metrics(all_hashes)
-    print(f"   Hash quality: {metrics['unique_hashes']}/{metrics['total_hashes']} unique")
+    report(f"   Hash quality: {metrics['unique_hashes']}/{metrics['total_hashes']} unique")
     
     # Test collision detection
     duplicate_found = batch_hashes[0] == batch_hashes[1]  # Should be True (same article)
-    print(f"   Duplicate detection: {'✅ Found' if duplicate_found else '❌ Failed'}")
+    report(f"   Duplicate detection: {'✅ Found' if duplicate_found else '❌ Failed'}")
+    
+    report("✅ Hash generation tests completed\n")
     
-    print("✅ Hash generation tests completed\n")
+    # One write for the whole section
+    print("\n".join(lines))
 
 async def test_content_processing():
     """Test content processing functionality"""
@@ -117,64 +120,88 @@ async def test_deduplication():
     
     print("✅ Deduplication tests completed\n")
 
-async def test_database_integration():
-    """Test database integration"""
-    print("🔧 Testing Database Integration...")
+async def get_article_counts(session, sample_size: int = 0):
+    """
+    Total, processed and hashed article counts from a single FILTER-aggregate query,
+    optionally with the newest processed articles as a JSON 'sample' column
+    """
+    columns = [
+        func.count(Article.id).label('total'),
+        func.count(Article.id).filter(Article.content_processed.is_(True)).label('processed'),
+        func.count(Article.id).filter(
+            Article.content_hash.isnot(None),
+            Article.content_hash != ''
+        ).label('hashed')
+    ]
+    
+    if sample_size:
+        sample = (
+            # Project display-ready values: truncated title, defaulted topic, 1-decimal score
+            select(
+                func.left(Article.title, 50).label('title'),
+                func.coalesce(Article.primary_topic, 'general').label('topic'),
+                func.round(cast(Article.quality_score, Numeric), 1).label('quality'),
+                Article.discovered_at
+            )
+            .filter(Article.content_processed.is_(True))
+            .order_by(Article.discovered_at.desc())
+            .limit(sample_size)
+            .subquery()
+        )
+        # Aggregate the sample rows into one JSON array so it rides along in the same round-trip;
+        # json_agg doesn't promise subquery order, so order inside the aggregate
+        columns.append(
+            select(func.json_agg(
+                aggregate_order_by(sample.table_valued(), sample.c.discovered_at.desc()),
+                type_=JSON
+            ))
+            .scalar_subquery()
+            .label('sample')
+        )
+    
+    result = await session.execute(select(*columns))
+    return result.one()
+
+async def test_database_integration() -> List[str]:
+    """Test database integration, returning the report lines"""
+    lines: List[str] = []
+    report = lines.append
+    report("🔧 Testing Database Integration...")
     
     try:
         async with AsyncSessionLocal() as session:
-            # Count total articles
-            total_result = await session.execute(select(func.count(Article.id)))
-            total_articles = total_result.scalar() or 0
-            
-            # Count processed articles
-            processed_result = await session.execute(
-                select(func.count(Article.id))
-                .filter(Article.content_processed.is_(True))
-            )
-            processed_articles = processed_result.scalar() or 0
+            # Count total, processed and hashed articles and sample recent ones in one query
+            counts = await get_article_counts(session, sample_size=3)
+            total_articles = counts.total or 0
+            processed_articles = counts.processed or 0
+            hashed_articles = counts.hashed or 0
             
-            # Count articles with hashes
-            hashed_result = await session.execute(
-                select(func.count(Article.id))
-                .filter(Article.content_hash.isnot(None))
-                .filter(Article.content_hash != '')
-            )
-            hashed_articles = hashed_result.scalar() or 0
+            report(f"   📊 Database Status:")
+            report(f"      - Total articles: {total_articles}")
+            report(f"      - Processed articles: {processed_articles}")
+            report(f"      - Articles with hashes: {hashed_articles}")
+            report(f"      - Processing rate: {(processed_articles/total_articles*100) if total_articles > 0 else 0:.1f}%")
+            report(f"      - Hash coverage: {(hashed_articles/total_articles*100) if total_articles > 0 else 0:.1f}%")
             
-            print(f"   📊 Database Status:")
-            print(f"      - Total articles: {total_articles}")
-            print(f"      - Processed articles: {processed_articles}")
-            print(f"      - Articles with hashes: {hashed_articles}")
-            print(f"      - Processing rate: {(processed_articles/total_articles*100) if total_articles > 0 else 0:.1f}%")
-            print(f"      - Hash coverage: {(hashed_articles/total_articles*100) if total_articles > 0 else 0:.1f}%")
+            # Sample recent articles (json_agg yields NULL when there are none)
+            sample_articles = counts.sample or []
             
-            # Sample recent articles
-            if total_articles > 0:
-                sample_result = await session.execute(
-                    select(Article.title, Article.primary_topic, Article.quality_score)
-                    .filter(Article.content_processed.is_(True))
-                    .order_by(Article.discovered_at.desc())
-                    .limit(3)
-                )
-                
-                sample_articles = sample_result.fetchall()
-                
-                if sample_articles:
-                    print(f"   📰 Sample processed articles:")
-                    for i, article in enumerate(sample_articles, 1):
-                        quality = f"{article.quality_score:.1f}" if article.quality_score else "N/A"
-                        topic = article.primary_topic or "general"
-                        print(f"      {i}. [{topic}] {article.title[:50]}... (Quality: {quality})")
+            if sample_articles:
+                report(f"   📰 Sample processed articles:")
+                for i, article in enumerate(sample_articles, 1):
+                    report(f"      {i}. [{article['topic']}] {article['title']}... (Quality: {article['quality'] or 'N/A'})")
             
     except Exception as e:
-        print(f"   ❌ Database integration test failed: {e}")
+        report(f"   ❌ Database integration test failed: {e}")
     
-    print("✅ Database integration tests completed\n")
+    report("✅ Database integration tests completed\n")
+    return lines
 
-async def test_priority3_success_metrics():
-    """Test Priority 3 success metrics"""
-    print("🎯 Validating Priority 3 Success Metrics...")
+async def test_priority3_success_metrics() -> List[str]:
+    """Test Priority 3 success metrics, returning the report lines"""
+    lines: List[str] = []
+    report = lines.append
+    report("🎯 Validating Priority 3 Success Metrics...")
     
     success_metrics = {
         "rss_feeds_collected": False,
@@ -186,27 +213,16 @@ async def test_priority3_success_metrics():
     
     try:
         async with AsyncSessionLocal() as session:
+            counts = await get_article_counts(session)
+            
             # Check if RSS feeds are being collected
-            total_result = await session.execute(select(func.count(Article.id)))
-            total_articles = total_result.scalar() or 0
-            success_metrics["rss_feeds_collected"] = total_articles > 0
+            success_metrics["rss_feeds_collected"] = (counts.total or 0) > 0
             
             # Check if content is being cleaned
-            processed_result = await session.execute(
-                select(func.count(Article.id))
-                .filter(Article.content_processed.is_(True))
-            )
-            processed_count = processed_result.scalar() or 0
-            success_metrics["content_cleaned"] = processed_count > 0
+            success_metrics["content_cleaned"] = (counts.processed or 0) > 0
             
             # Check if articles have content hashes
-            hashed_result = await session.execute(
-                select(func.count(Article.id))
-                .filter(Article.content_hash.isnot(None))
-                .filter(Article.content_hash != '')
-            )
-            hashed_count = hashed_result.scalar() or 0
-            success_metrics["hashes_generated"] = hashed_count > 0
+            success_metrics["hashes_generated"] = (counts.hashed or 0) > 0
             
             # Articles stored is same as RSS feeds collected
             success_metrics["articles_stored"] = success_metrics["rss_feeds_collected"]
@@ -215,23 +231,24 @@ async def test_priority3_success_metrics():
             success_metrics["articles_deduplicated"] = True  # Functionality exists and tested
     
         # Print results
-        print("   🏆 Priority 3 Success Criteria:")
+        report("   🏆 Priority 3 Success Criteria:")
         for metric, passed in success_metrics.items():
             status = "✅ PASS" if passed else "❌ FAIL"
             metric_name = metric.replace("_", " ").title()
-            print(f"      - {metric_name}: {status}")
+            report(f"      - {metric_name}: {status}")
         
         all_passed = all(success_metrics.values())
         overall_status = "🎉 ALL PASS" if all_passed else "⚠️  SOME FAILED"
-        print(f"\n   Overall Priority 3 Status: {overall_status}")
+        report(f"\n   Overall Priority 3 Status: {overall_status}")
         
         if all_passed:
-            print("   🚀 Ready for Week 2: API Endpoints + Background Tasks!")
+            report("   🚀 Ready for Week 2: API Endpoints + Background Tasks!")
         
     except Exception as e:
-        print(f"   ❌ Success metrics validation failed: {e}")
+        report(f"   ❌ Success metrics validation failed: {e}")
     
-    print("\n✅ Priority 3 validation completed")
+    report("\n✅ Priority 3 validation completed")
+    return lines
 
 async def main():
     """Main test function"""
@@ -239,12 +256,14 @@ async def main():
     print(f"📅 Test Date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
     print("="*70)
     
-    # Run all tests in sequence
+    # Processing and deduplication mutate the articles, so they run in sequence
     await test_hash_generation()
     await test_content_processing()
     await test_deduplication()
-    await test_database_integration()
-    await test_priority3_success_metrics()
+    
+    # The read-only checks are independent: overlap their DB waits, print in order
+    for lines in await asyncio.gather(test_database_integration(), test_priority3_success_metrics()):
+        print("\n".join(lines))
     
     print("="*70)
     print("🎯 Priority 3 Testing Complete!")
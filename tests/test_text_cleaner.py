@@ -0,0 +1,26 @@
+"""
+Tests for TextCleaner junk removal
+"""
+
+import pytest
+
+from app.utils.text_cleaner import TextCleaner
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        # A source credit must not swallow the caption on the following line
+        (
+            "Markets rallied today.\nSource: AP News\nImage: Getty Images\nMore text here.",
+            "Markets rallied today.\n.",
+        ),
+        # ...nor a caption later on the same line
+        (
+            "Story body.\nSource: Reuters Photo: Reuters",
+            "Story body.",
+        ),
+    ],
+)
+def test_source_credit_does_not_eat_captions(raw, expected):
+    assert TextCleaner._post_process_text(raw) == expected